@@ -3,18 +3,44 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import logging
+import logging.handlers
 import sys
+import threading
 
-from jarvis.config import Config
+from jarvis.config import Config, get_config
+
+# Buffered records are flushed this often; errors flush immediately.
+LOG_FLUSH_INTERVAL_S = 1.0
 
 
 def setup_logging(level: str) -> None:
-    logging.basicConfig(
-        level=getattr(logging, level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)-8s %(name)s — %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s %(levelname)-8s %(name)s — %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    # Buffer records in memory so the poller hot path doesn't pay a write()
+    # syscall per log line; ERROR and above flush through immediately.
+    buffered = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=stream
     )
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+    root.addHandler(buffered)
+    atexit.register(buffered.flush)
+
+    def _flush_periodically() -> None:
+        buffered.flush()
+        timer = threading.Timer(LOG_FLUSH_INTERVAL_S, _flush_periodically)
+        timer.daemon = True
+        timer.start()
+
+    _flush_periodically()
 
 
 def cmd_poll(config: Config, args: argparse.Namespace) -> None:
@@ -28,9 +54,14 @@ def cmd_poll_once(config: Config, args: argparse.Namespace) -> None:
 
 
 def cmd_run(config: Config, args: argparse.Namespace) -> None:
+    import dataclasses
+
     from jarvis.orchestrator import Orchestrator
     from jarvis.models import Trigger
 
+    if args.no_cache:
+        config = dataclasses.replace(config, agent_cache=False)
+
     repo = args.repo
     if not repo:
         if len(config.target_repos) == 1:
@@ -49,6 +80,13 @@ def cmd_webhook(config: Config, args: argparse.Namespace) -> None:
     run_webhook(config)
 
 
+def _format_run_row(r) -> str:
+    repo_tag = f" [{r.repo}]" if r.repo else ""
+    pr = f" -> {r.pr_url}" if r.pr_url else ""
+    err = f" | error: {r.error[:80]}" if r.error else ""
+    return f"  #{r.id:>4}  issue={r.issue_number:<6} {r.status.value:<8} {r.trigger.value:<8}{repo_tag} {r.created_at}{pr}{err}"
+
+
 def cmd_status(config: Config, args: argparse.Namespace) -> None:
     from jarvis.db import Database
     db = Database(config.db_path)
@@ -62,11 +100,8 @@ def cmd_status(config: Config, args: argparse.Namespace) -> None:
         print("No runs found.")
         return
 
-    for r in runs:
-        repo_tag = f" [{r.repo}]" if r.repo else ""
-        pr = f" -> {r.pr_url}" if r.pr_url else ""
-        err = f" | error: {r.error[:80]}" if r.error else ""
-        print(f"  #{r.id:>4}  issue={r.issue_number:<6} {r.status.value:<8} {r.trigger.value:<8}{repo_tag} {r.created_at}{pr}{err}")
+    # One formatting pass per row, one buffered write for the whole table.
+    sys.stdout.write("\n".join(_format_run_row(r) for r in runs) + "\n")
 
 
 def cmd_report(config: Config, args: argparse.Namespace) -> None:
@@ -80,7 +115,9 @@ def cmd_report(config: Config, args: argparse.Namespace) -> None:
         print(format_summary_report(db))
 
 
-def main() -> None:
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Built once per process; repeat in-process invocations reuse it."""
     parser = argparse.ArgumentParser(prog="jarvis", description="Jarvis22 — Autonomous coding agent orchestrator")
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -90,6 +127,7 @@ def main() -> None:
     run_parser = sub.add_parser("run", help="Process a single issue")
     run_parser.add_argument("issue_number", type=int, help="GitHub issue number")
     run_parser.add_argument("--repo", type=str, default="", help="Target repo (owner/repo). Required if multiple repos configured.")
+    run_parser.add_argument("--no-cache", action="store_true", help="Skip the agent response cache for this run")
 
     sub.add_parser("webhook", help="Start webhook server")
 
@@ -99,8 +137,12 @@ def main() -> None:
     report_parser = sub.add_parser("report", help="Show run report")
     report_parser.add_argument("issue_number", type=int, nargs="?", help="Show report for specific issue")
 
-    args = parser.parse_args()
-    config = Config.from_env()
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    config = get_config()
     setup_logging(config.log_level)
 
     # Validate config for commands that need external services
@@ -9,11 +9,22 @@ Both roles can be routed to different backends (claude/codex/gemini).
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
+import json
 import logging
 import os
+import queue
+import re
+import shutil
+import signal
 import subprocess
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
+from jarvis.agent_cache import AgentCache, repo_head
 from jarvis.config import Config
 from jarvis.models import IssueContext
 
@@ -73,43 +84,364 @@ UNAVAILABLE_PATTERNS = (
     "pass --to",
 )
 
+# One C-level pass instead of a Python-level substring scan per pattern.
+_UNAVAIL_RE = re.compile("|".join(re.escape(p) for p in UNAVAILABLE_PATTERNS), re.IGNORECASE)
+
 
 def _is_unavailable_error(text: str) -> bool:
-    low = text.lower()
-    return any(p in low for p in UNAVAILABLE_PATTERNS)
+    # Limit/turn-exhaustion messages land near the end of output; scanning
+    # only the last 8 KiB keeps this constant-time on huge transcripts.
+    return _UNAVAIL_RE.search(text[-8192:]) is not None
 
 
-def _run_cmd(name: str, cmd: list[str], prompt: str, work_dir: Path, env: dict[str, str], timeout: int = 900) -> str:
-    log.info("Spawning %s in %s", name, work_dir)
+@functools.lru_cache(maxsize=8)
+def _resolve_bin(name: str) -> str:
+    """Absolute path for an agent binary, resolved once per process.
+
+    Skips the execve PATH walk on every spawn; falls back to the bare name
+    so a missing binary still surfaces as the usual FileNotFoundError.
+    """
+    return shutil.which(name) or name
+
+
+def _agent_preexec() -> None:
+    """Run agent subprocesses at slightly lower priority.
+
+    With concurrent issues in flight, the LLM CLI (a Node process doing
+    heavy JSON/tokenization work) competes with short git commands and HTTP
+    handling; nice +5 lets those preempt it. No-op where unsupported.
+    """
     try:
-        result = subprocess.run(
+        os.nice(5)
+    except (AttributeError, OSError):
+        pass
+
+
+# Respawn a worker after this many prompts so long-lived sessions don't
+# accumulate context or leak memory in the claude process.
+WORKER_MAX_USES = 20
+
+
+class ClaudeWorker:
+    """A long-lived `claude` process reusing one authenticated session.
+
+    Spawning `claude` per prompt pays the Node.js binary startup plus the
+    auth handshake (~seconds) on every call. A worker keeps one process
+    alive in stream-json mode and sends each prompt as a single frame over
+    stdin, reading stdout until the terminating `{"type": "result"}` frame.
+    """
+
+    def __init__(self, config: Config, work_dir: Path, env: dict[str, str]) -> None:
+        self._config = config
+        self._work_dir = work_dir
+        self._env = env
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._uses = 0
+
+    @staticmethod
+    def _drain_stdout(stdout, lines: queue.Queue[str | None]) -> None:
+        # Dedicated reader: select() on a buffered text stream deadlocks
+        # when several frames arrive in one read — readline() pulls them all
+        # into the TextIOWrapper buffer, the fd goes quiet, and the already-
+        # buffered result frame is never surfaced. Blocking readline in a
+        # thread delivers every buffered frame; None marks EOF.
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _ensure_proc(self) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        cmd = [
+            _resolve_bin("claude"),
+            "--print",
+            "--dangerously-skip-permissions",
+            "--model",
+            self._config.claude_model,
+            "--max-turns",
+            "30",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+        ]
+        log.info("Spawning persistent claude worker in %s", self._work_dir)
+        self._proc = subprocess.Popen(
             cmd,
-            input=prompt,
-            cwd=work_dir,
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self._work_dir,
+            env=self._env,
             text=True,
-            timeout=timeout,
-            env=env,
+            bufsize=1,
+            start_new_session=True,
+            preexec_fn=_agent_preexec,
         )
+        # Fresh queue per process so a stale reader can't feed frames from a
+        # killed session into the new one.
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._drain_stdout, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+        self._uses = 0
+        return self._proc
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+                self._proc.wait(timeout=5)
+            except Exception:
+                pass
+            self._proc = None
+
+    def send(self, prompt: str, timeout: int = 900) -> str:
+        """Send one prompt and block until the result frame arrives."""
+        with self._lock:
+            proc = self._ensure_proc()
+            frame = json.dumps({"type": "user", "message": {"role": "user", "content": prompt}})
+            try:
+                proc.stdin.write(frame + "\n")
+                proc.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                self._kill()
+                raise AgentUnavailableError(f"claude worker pipe closed: {e}") from e
+
+            deadline = time.monotonic() + timeout
+            parts: list[str] = []
+            lines = self._lines
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill()
+                    raise AgentUnavailableError(f"claude unavailable: timeout after {timeout}s")
+                try:
+                    line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if line is None:
+                    self._kill()
+                    raise AgentUnavailableError("claude worker exited mid-response")
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError:
+                    # Garbage on the stream means the session is unusable.
+                    self._kill()
+                    raise AgentUnavailableError("claude worker emitted unparseable frame")
+                if msg.get("type") == "result":
+                    self._uses += 1
+                    if self._uses >= WORKER_MAX_USES:
+                        self._kill()
+                    usage = msg.get("usage") or {}
+                    if usage:
+                        log.info(
+                            "claude usage: in=%s out=%s",
+                            usage.get("input_tokens", 0),
+                            usage.get("output_tokens", 0),
+                        )
+                    result = msg.get("result") or "\n".join(parts)
+                    if msg.get("is_error"):
+                        raise AgentUnavailableError(f"claude unavailable: {str(result)[:300]}")
+                    return result
+                if msg.get("type") == "assistant":
+                    for block in msg.get("message", {}).get("content", []):
+                        if isinstance(block, dict) and block.get("type") == "text":
+                            parts.append(block.get("text", ""))
+
+    def close(self) -> None:
+        with self._lock:
+            self._kill()
+
+
+class WorkerPool:
+    """Persistent workers keyed by (backend, work_dir); cwd is fixed at spawn.
+
+    Only claude currently speaks a persistent stdin-framing protocol
+    (stream-json); the codex CLI has no equivalent loop mode, so codex calls
+    fall through to one-shot _run_cmd and worker_for returns None for it.
+    Adding a warm backend later only requires a worker class and an entry
+    in _WORKER_CLASSES.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._workers: dict[tuple[str, Path], ClaudeWorker] = {}
+
+    def worker_for(self, config: Config, backend: str, work_dir: Path, env: dict[str, str]) -> ClaudeWorker | None:
+        worker_cls = _WORKER_CLASSES.get(backend)
+        if worker_cls is None:
+            return None
+        key = (backend, work_dir)
+        with self._lock:
+            worker = self._workers.get(key)
+            if worker is None:
+                worker = worker_cls(config, work_dir, env)
+                self._workers[key] = worker
+            return worker
+
+    def close_for_dir(self, work_dir: Path) -> None:
+        """Close and evict every worker rooted in work_dir.
+
+        Must run before the directory is deleted: a pooled worker's cwd is
+        fixed at spawn, so leaving it alive leaks the process, and a later
+        run reusing the same path would get a worker editing a tree that no
+        longer exists.
+        """
+        with self._lock:
+            stale = [key for key in self._workers if key[1] == work_dir]
+            for key in stale:
+                self._workers.pop(key).close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            for worker in self._workers.values():
+                worker.close()
+            self._workers.clear()
+
+
+_WORKER_CLASSES: dict[str, type[ClaudeWorker]] = {"claude": ClaudeWorker}
+
+_worker_pool = WorkerPool()
+
+
+def close_workers_for(work_dir: Path) -> None:
+    """Close pooled workers spawned in work_dir (call before deleting it)."""
+    _worker_pool.close_for_dir(work_dir)
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """SIGTERM the whole process group, escalating to SIGKILL after 3s.
+
+    The child is spawned with start_new_session=True, so its pgid is its
+    pid by construction. That pid is used directly: resolving it via
+    os.getpgid fails once the child has been reaped, and the group must
+    still be killable then — grandchildren outliving the child is the
+    main case this function exists for.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=3)
+    except (subprocess.TimeoutExpired, ProcessLookupError, OSError):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, OSError):
+            pass
+
+
+# Rolling line buffers: enough tail to diagnose failures and feed the
+# verdict/availability parsers without holding multi-MB transcripts.
+STDOUT_BUFFER_LINES = 10000
+STDERR_BUFFER_LINES = 2000
+
+
+def _drain(stream, buf: deque) -> None:
+    for line in stream:
+        buf.append(line)
+    stream.close()
+
+
+def _run_with_hard_timeout(
+    cmd: list[str], prompt: str, work_dir: Path, env: dict[str, str], timeout: int
+) -> tuple[int, bytes, bytes]:
+    """Run cmd with a wall-clock bound that holds even when grandchildren hold pipes open.
+
+    `subprocess.run(timeout=...)` only raises once the child's pipes close, so
+    a hung claude/codex invocation with Node grandchildren can run 2-3x the
+    configured timeout. Spawning in a fresh session and killing the process
+    group makes the timeout hard.
+
+    Output is streamed line-by-line into bounded deques rather than buffered
+    whole via capture_output, so verbose multi-megabyte transcripts neither
+    stall the pipe nor pin memory, and a timeout still yields partial output
+    (attached to TimeoutExpired) instead of nothing.
+
+    The pipes run in binary mode: the prompt is encoded once, and callers
+    decode only the portions of the output they actually consume.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=work_dir,
+        env=env,
+        start_new_session=True,
+        preexec_fn=_agent_preexec,
+    )
+    stdout_buf: deque[bytes] = deque(maxlen=STDOUT_BUFFER_LINES)
+    stderr_buf: deque[bytes] = deque(maxlen=STDERR_BUFFER_LINES)
+    readers = [
+        threading.Thread(target=_drain, args=(proc.stdout, stdout_buf), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, stderr_buf), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+
+    def _feed_stdin() -> None:
+        try:
+            proc.stdin.write(prompt.encode("utf-8"))
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    writer = threading.Thread(target=_feed_stdin, daemon=True)
+    writer.start()
+
+    deadline = time.monotonic() + timeout
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        for t in readers:
+            t.join(timeout=1)
+        raise subprocess.TimeoutExpired(
+            cmd, timeout, output=b"".join(stdout_buf), stderr=b"".join(stderr_buf)
+        ) from None
+    # The child exited, but grandchildren it left behind can keep the pipes
+    # open indefinitely — the exact failure this function guards against —
+    # so the drain join is bounded by the remaining deadline, and the group
+    # is killed if the readers still haven't seen EOF by then.
+    for t in readers:
+        t.join(timeout=max(0.0, deadline - time.monotonic()))
+    if any(t.is_alive() for t in readers):
+        _kill_process_group(proc)
+        for t in readers:
+            t.join(timeout=1)
+    writer.join(timeout=1)
+    return proc.returncode, b"".join(stdout_buf), b"".join(stderr_buf)
+
+
+def _run_cmd(name: str, cmd: list[str], prompt: str, work_dir: Path, env: dict[str, str], timeout: int = 900) -> str:
+    log.info("Spawning %s in %s", name, work_dir)
+    try:
+        returncode, output_b, stderr_b = _run_with_hard_timeout(cmd, prompt, work_dir, env, timeout)
     except subprocess.TimeoutExpired as e:
-        raise AgentUnavailableError(f"{name} unavailable: timeout after {timeout}s") from e
+        partial = (e.output or b"")[-300:].decode("utf-8", errors="replace")
+        suffix = f"; partial output: {partial}" if partial else ""
+        raise AgentUnavailableError(f"{name} unavailable: timeout after {timeout}s{suffix}") from e
 
-    output = result.stdout or ""
-    stderr = result.stderr or ""
-    combined = f"{output}\n{stderr}".strip()
+    # Decode only the tails needed for error detection; the full stdout is
+    # decoded once, on the success path only.
+    tail = (output_b[-8192:] + b"\n" + stderr_b[-8192:]).decode("utf-8", errors="replace").strip()
+    stderr_head = stderr_b[:500].decode("utf-8", errors="replace")
 
     # Some CLIs return exit=0 but print limit/turn exhaustion.
-    if _is_unavailable_error(combined):
-        raise AgentUnavailableError(f"{name} unavailable: {stderr[:300] or output[:300]}")
+    if _is_unavailable_error(tail):
+        raise AgentUnavailableError(f"{name} unavailable: {stderr_head[:300] or tail[:300]}")
 
-    if result.returncode != 0:
-        raise RuntimeError(f"{name} exited with code {result.returncode}: {stderr[:500] or output[:500]}")
+    if returncode != 0:
+        out_head = output_b[:500].decode("utf-8", errors="replace")
+        raise RuntimeError(f"{name} exited with code {returncode}: {stderr_head or out_head}")
 
-    return output
+    return output_b.decode("utf-8", errors="replace")
 
 
 def implementer_prompt(issue: IssueContext, extra_instructions: str = "") -> str:
-    labels_text = ", ".join(issue.labels) if issue.labels else "(none)"
+    labels_text = issue.labels_text
     extra = f"\n\nAdditional instructions:\n{extra_instructions.strip()}" if extra_instructions.strip() else ""
     return f"""\
 {IMPLEMENTER_SYSTEM_PROMPT}
@@ -125,7 +457,7 @@ Solve this issue. Remember: do NOT run any git commands."""
 
 
 def reviewer_prompt(issue: IssueContext, diffstat: str, diff: str, test_output: str = "") -> str:
-    labels_text = ", ".join(issue.labels) if issue.labels else "(none)"
+    labels_text = issue.labels_text
     test_block = ""
     if test_output.strip():
         test_block = f"\n\nTEST OUTPUT (most recent):\n{test_output.strip()}"
@@ -146,73 +478,165 @@ DIFF:\n{diff}{test_block}
 """
 
 
-def backend_order(config: Config, issue: IssueContext) -> list[str]:
-    labels = {l.lower() for l in issue.labels}
+# The routing tables below derive purely from Config, so they're computed
+# once per Config (frozen, hashable) rather than per issue.
 
-    preferred = ""
-    if config.model_label_claude.lower() in labels:
-        preferred = "claude"
-    elif config.model_label_codex.lower() in labels:
-        preferred = "codex"
-    elif config.model_label_gemini.lower() in labels:
-        preferred = "claude"
-
-    default_order = ["claude", "codex"]
-    if not preferred:
-        return default_order
-    return [preferred] + [name for name in default_order if name != preferred]
 
+@functools.lru_cache(maxsize=4)
+def _label_routing(config: Config) -> tuple[tuple[str, str], ...]:
+    return (
+        (config.model_label_claude.lower(), "claude"),
+        (config.model_label_codex.lower(), "codex"),
+        (config.model_label_gemini.lower(), "claude"),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _model_label_set(config: Config) -> frozenset[str]:
+    return frozenset(label for label, _ in _label_routing(config))
 
-def reviewer_backend_order(config: Config, issue: IssueContext) -> list[str]:
-    # Respect explicit model labels if present; otherwise use configured order.
-    explicit = backend_order(config, issue)
-    labels = {l.lower() for l in issue.labels}
-    if labels.intersection(
-        {
-            config.model_label_claude.lower(),
-            config.model_label_codex.lower(),
-            config.model_label_gemini.lower(),
-        }
-    ):
-        return explicit
 
+@functools.lru_cache(maxsize=4)
+def _parsed_reviewer_order(config: Config) -> tuple[str, ...]:
     raw = [p.strip().lower() for p in config.reviewer_backend_order.split(",") if p.strip()]
     order = [b for b in raw if b in {"claude", "codex"}]
     # Ensure all are present at least once
     for b in ("claude", "codex"):
         if b not in order:
             order.append(b)
-    return order
+    return tuple(order)
+
+
+@functools.lru_cache(maxsize=256)
+def _backend_order_for(config: Config, labels: frozenset[str]) -> tuple[str, ...]:
+    preferred = ""
+    for label, backend in _label_routing(config):
+        if label in labels:
+            preferred = backend
+            break
+
+    if not preferred:
+        return ("claude", "codex")
+    return (preferred,) + tuple(name for name in ("claude", "codex") if name != preferred)
+
+
+@functools.lru_cache(maxsize=256)
+def _reviewer_order_for(config: Config, labels: frozenset[str]) -> tuple[str, ...]:
+    # Respect explicit model labels if present; otherwise use configured order.
+    if labels & _model_label_set(config):
+        return _backend_order_for(config, labels)
+    return _parsed_reviewer_order(config)
+
+
+def backend_order(config: Config, issue: IssueContext) -> list[str]:
+    # Pure in (config, labels); memoized since the same label combinations
+    # recur on every poll cycle.
+    return list(_backend_order_for(config, issue.labels_lower))
+
+
+def reviewer_backend_order(config: Config, issue: IssueContext) -> list[str]:
+    return list(_reviewer_order_for(config, issue.labels_lower))
+
 
+@functools.lru_cache(maxsize=4)
+def _base_env(config: Config) -> dict[str, str]:
+    """Subprocess environment built once per Config instead of per call.
 
-def run_backend(config: Config, work_dir: Path, backend: str, prompt: str) -> str:
-    env = os.environ.copy()
+    Callers must not mutate the returned dict; per-call overrides should
+    merge with `{**_base_env(config), ...}`.
+    """
+    env = dict(os.environ)
     if config.anthropic_api_key:
         env["ANTHROPIC_API_KEY"] = config.anthropic_api_key
+    return env
+
 
+def _backend_model(config: Config, backend: str) -> str:
     if backend == "claude":
-        cmd = [
-            "claude",
-            "--print",
-            "--dangerously-skip-permissions",
-            "--model",
-            config.claude_model,
-            "--max-turns",
-            "30",
-        ]
-        out = _run_cmd("claude", cmd, prompt, work_dir, env)
+        return config.claude_model
+    if backend == "codex":
+        return config.codex_model
+    return config.gemini_model
+
+
+def run_backend(config: Config, work_dir: Path, backend: str, prompt: str, cacheable: bool = False, read_only: bool = False) -> str:
+    env = _base_env(config)
+
+    # Read-only calls (the reviewer) are safe to replay from cache: same
+    # prompt + same repo HEAD means the subprocess would redo identical work.
+    cache = None
+    cache_key = ""
+    if cacheable and config.agent_cache:
+        head = repo_head(work_dir)
+        if head:
+            cache = AgentCache(config.db_path)
+            cache_key = AgentCache.make_key(backend, _backend_model(config, backend), prompt, head)
+            hit = cache.get(cache_key)
+            if hit is not None:
+                log.info("Agent cache hit for %s", backend)
+                return hit
+
+    out = _run_backend_uncached(config, work_dir, backend, prompt, env, read_only=read_only)
+    if cache is not None:
+        cache.put(cache_key, out)
+    return out
+
+
+# Tools a read-only claude invocation must not have: anything that writes
+# the tree or runs arbitrary commands.
+_CLAUDE_WRITE_TOOLS = "Write,Edit,MultiEdit,NotebookEdit,Bash"
+
+
+def _run_backend_uncached(config: Config, work_dir: Path, backend: str, prompt: str, env: dict[str, str], read_only: bool = False) -> str:
+    if backend == "claude":
+        if read_only:
+            # The pooled worker runs with --dangerously-skip-permissions and
+            # is the same session the implementer uses in this worktree, so
+            # a hedged loser finishing late could edit the tree. Read-only
+            # callers get a one-shot invocation with write tools disallowed
+            # instead.
+            cmd = [
+                _resolve_bin("claude"),
+                "--print",
+                "--model",
+                config.claude_model,
+                "--max-turns",
+                "30",
+                "--disallowedTools",
+                _CLAUDE_WRITE_TOOLS,
+            ]
+            try:
+                out = _run_cmd("claude", cmd, prompt, work_dir, env)
+            except FileNotFoundError as e:
+                raise AgentUnavailableError(f"claude unavailable: {e}") from e
+            return f"[backend:claude]\n{out}"
+        worker = _worker_pool.worker_for(config, "claude", work_dir, env)
+        try:
+            out = worker.send(prompt)
+        except FileNotFoundError as e:
+            raise AgentUnavailableError(f"claude unavailable: {e}") from e
+        if _is_unavailable_error(out):
+            raise AgentUnavailableError(f"claude unavailable: {out[:300]}")
         return f"[backend:claude]\n{out}"
 
     if backend == "codex":
         # Prefer real Codex CLI if available. Some environments have a wrapper
         # that routes through OpenClaw; we still treat it as a backend.
-        cmd = ["codex", "exec", "--full-auto", prompt]
+        # read_only callers (the reviewer) get the read-only sandbox instead
+        # of --full-auto so codex can't modify the shared tree.
+        codex_bin = _resolve_bin("codex")
+        mode = ["--sandbox", "read-only"] if read_only else ["--full-auto"]
+        cmd = [codex_bin, "exec", *mode, prompt]
         if config.codex_model:
-            cmd = ["codex", "exec", "--full-auto", "--model", config.codex_model, prompt]
+            cmd = [codex_bin, "exec", *mode, "--model", config.codex_model, prompt]
         try:
             out = _run_cmd("codex", cmd, prompt, work_dir, env)
         except RuntimeError:
-            out = _run_cmd("codex", ["codex", prompt], prompt, work_dir, env)
+            if read_only:
+                # Never fall back to an unsandboxed invocation for a caller
+                # that asked for read-only.
+                raise
+            out = _run_cmd("codex", [codex_bin, prompt], prompt, work_dir, env)
         return f"[backend:codex]\n{out}"
 
     if backend == "gemini":
@@ -221,19 +645,62 @@ def run_backend(config: Config, work_dir: Path, backend: str, prompt: str) -> st
     raise RuntimeError(f"Unknown backend: {backend}")
 
 
+def run_backends_hedged(config: Config, work_dir: Path, backends: list[str], prompt: str, cacheable: bool = True) -> tuple[str, str]:
+    """Run all backends concurrently; the first successful response wins.
+
+    Only safe for read-only roles (the reviewer): the backends share
+    work_dir, and a losing backend keeps running detached after the winner
+    returns, so every backend is invoked with read_only=True — a loser
+    finishing late must not be able to dirty the tree mid-round. A slow or
+    rate-limited first-choice backend no longer blocks the others from even
+    starting. Returns (backend, output); raises AgentUnavailableError if
+    every backend fails.
+    """
+    if len(backends) == 1:
+        return backends[0], run_backend(config, work_dir, backends[0], prompt, cacheable=cacheable, read_only=True)
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=len(backends))
+    try:
+        futures = {pool.submit(run_backend, config, work_dir, b, prompt, cacheable, True): b for b in backends}
+        errors: list[str] = []
+        pending = set(futures)
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for f in done:
+                backend = futures[f]
+                try:
+                    out = f.result()
+                except Exception as e:
+                    errors.append(f"{backend}: {e}")
+                    continue
+                log.info("Hedged run: %s won", backend)
+                return backend, out
+        raise AgentUnavailableError("all backends unavailable: " + "; ".join(errors))
+    finally:
+        # Don't block on the losers; their threads drain in the background.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_VERDICT_RE = re.compile(r"(?im)^\s*verdict:\s*(approve|changes)")
+
+
 def parse_reviewer_verdict(text: str) -> tuple[str, str]:
-    """Return (verdict, normalized_text)."""
+    """Return (verdict, normalized_text).
+
+    Deliberately runs in-process: the precompiled regex scans at most 4KB,
+    which is microseconds — far below the pickling cost of shipping the
+    text to a worker process.
+    """
     t = (text or "").strip()
-    low = t.lower()
-    if "verdict:" in low:
-        for line in t.splitlines():
-            if line.lower().startswith("verdict:"):
-                v = line.split(":", 1)[1].strip().upper()
-                if "APPROVE" in v:
-                    return "APPROVE", t
-                if "CHANGES" in v:
-                    return "CHANGES_REQUESTED", t
+    # The VERDICT line sits near the top per the prompt template, so only
+    # the head needs scanning — no splitlines list or full-text lowercase.
+    head = t[:4096]
+    m = _VERDICT_RE.search(head)
+    if m:
+        verdict = "APPROVE" if m.group(1).lower() == "approve" else "CHANGES_REQUESTED"
+        return verdict, t
     # Fallback heuristic
+    low = head.lower()
     if "approve" in low and "changes" not in low:
         return "APPROVE", t
     return "CHANGES_REQUESTED", t
@@ -0,0 +1,68 @@
+"""Content-addressed cache of agent responses.
+
+Webhook retries, poller re-triggers, and repeated `jarvis run` invocations
+can replay the exact same prompt against the exact same repo state. A cache
+keyed by (backend, model, prompt, repo HEAD) turns those replays into a
+single SQLite lookup instead of a multi-minute subprocess.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import subprocess
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """\
+CREATE TABLE IF NOT EXISTS agent_cache (
+    key        TEXT PRIMARY KEY,
+    output     TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+"""
+
+
+def repo_head(work_dir: Path) -> str:
+    """Current HEAD sha of work_dir, or '' if it isn't a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=work_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    if result.returncode != 0:
+        return ""
+    return result.stdout.strip()
+
+
+class AgentCache:
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    @staticmethod
+    def make_key(backend: str, model: str, prompt: str, head: str) -> str:
+        return hashlib.blake2b(f"{backend}|{model}|{prompt}|{head}".encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT output FROM agent_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, key: str, output: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO agent_cache (key, output) VALUES (?, ?)",
+                (key, output),
+            )
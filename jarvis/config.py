@@ -3,16 +3,95 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
 
+# owner/repo with exactly one slash and no whitespace.
+_REPO_RE = re.compile(r"^[^/\s]+/[^/\s]+$")
 
-@dataclass(frozen=True)
+
+def _positive_int(raw: str) -> int:
+    return max(1, int(raw))
+
+
+def _flag(raw: str) -> bool:
+    return raw.lower() in ("true", "1", "yes")
+
+
+def _flag_default_on(raw: str) -> bool:
+    return raw.lower() not in ("false", "0", "no")
+
+
+# (field, env key, default, converter). None converter keeps the raw string.
+# target_repos is special-cased in from_env (comma-split into a tuple).
+_ENV_SPEC = (
+    ("github_token", "GITHUB_TOKEN", "", None),
+    ("anthropic_api_key", "ANTHROPIC_API_KEY", "", None),
+    ("poll_interval", "POLL_INTERVAL", "60", int),
+    ("max_issues_per_poll", "MAX_ISSUES_PER_POLL", "1", _positive_int),
+    ("poll_concurrency", "POLL_CONCURRENCY", "1", _positive_int),
+    ("max_poll_interval", "MAX_POLL_INTERVAL", "600", int),
+
+    ("issue_label", "ISSUE_LABEL", "jarvis", None),
+    ("ready_label", "READY_LABEL", "jarvis-ready", None),
+    ("done_label", "DONE_LABEL", "jarvis-done", None),
+    ("needs_human_label", "NEEDS_HUMAN_LABEL", "jarvis-needs-human", None),
+
+    ("model_label_claude", "MODEL_LABEL_CLAUDE", "jarvis-cl", None),
+    ("model_label_codex", "MODEL_LABEL_CODEX", "jarvis-co", None),
+    ("model_label_gemini", "MODEL_LABEL_GEMINI", "jarvis-ge", None),
+
+    ("workspace_dir", "WORKSPACE_DIR", "/tmp/jarvis-workspace", None),
+    ("shallow_clone", "SHALLOW_CLONE", "true", _flag_default_on),
+    ("shallow_clone_depth", "SHALLOW_CLONE_DEPTH", "1", _positive_int),
+    ("repo_refresh_s", "REPO_REFRESH_S", "0", int),
+    ("db_path", "DB_PATH", "jarvis.db", None),
+    ("branch_prefix", "BRANCH_PREFIX", "jarvis/issue-", None),
+
+    ("agent_cache", "AGENT_CACHE", "true", _flag_default_on),
+
+    ("claude_model", "CLAUDE_MODEL", "sonnet", None),
+    ("codex_model", "CODEX_MODEL", "", None),
+    ("gemini_model", "GEMINI_MODEL", "", None),
+
+    ("review_rounds", "REVIEW_ROUNDS", "2", int),
+    ("reviewer_backend_order", "REVIEWER_BACKEND_ORDER", "claude,codex", None),
+
+    ("test_cmd", "TEST_CMD", "", None),
+    ("test_timeout_s", "TEST_TIMEOUT_S", "900", int),
+
+    ("webhook_port", "WEBHOOK_PORT", "8080", int),
+    ("max_concurrent_runs", "MAX_CONCURRENT_RUNS", "2", _positive_int),
+    ("webhook_secret", "WEBHOOK_SECRET", "", None),
+
+    ("log_level", "LOG_LEVEL", "INFO", None),
+    ("session_timeout", "SESSION_TIMEOUT", "7200", int),
+    ("issue_timeout", "ISSUE_TIMEOUT", "1800", int),
+    ("max_diff_files", "MAX_DIFF_FILES", "40", int),
+    ("max_diff_loc", "MAX_DIFF_LOC", "1000", int),
+    ("max_tokens_per_run", "MAX_TOKENS_PER_RUN", "180000", int),
+    ("token_warning_buffer", "TOKEN_WARNING_BUFFER", "5000", int),
+    ("codex_binary", "CODEX_BINARY", "node /usr/lib/node_modules/@openai/codex/bin/codex.js", None),
+    ("reports_dir", "REPORTS_DIR", "reports", None),
+    ("jarvis_repo_dir", "JARVIS_REPO_DIR", "", None),
+    ("publish", "PUBLISH", "", _flag),
+)
+
+# A duplicated entry would silently shadow an earlier one in from_env's
+# dict comprehension and waste an env lookup; fail loudly at import instead.
+assert len({field for field, *_ in _ENV_SPEC}) == len(_ENV_SPEC), "duplicate field in _ENV_SPEC"
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     github_token: str = ""
     target_repos: tuple[str, ...] = ()
     anthropic_api_key: str = ""
     poll_interval: int = 60
     max_issues_per_poll: int = 1
+    poll_concurrency: int = 1
+    # Ceiling for the idle backoff in run_poller
+    max_poll_interval: int = 600
 
     # Labeling
     issue_label: str = "jarvis"
@@ -26,9 +105,18 @@ class Config:
     model_label_gemini: str = "jarvis-ge"
 
     workspace_dir: str = "/tmp/jarvis-workspace"
+    # Clone with --depth=N --filter=blob:none; the agent only needs the tip tree
+    shallow_clone: bool = True
+    shallow_clone_depth: int = 1
+    # Skip re-fetching a clone whose last fetch is younger than this many
+    # seconds (0 = always fetch)
+    repo_refresh_s: int = 0
     db_path: str = "jarvis.db"
     branch_prefix: str = "jarvis/issue-"
 
+    # Agent response cache (read-only calls only)
+    agent_cache: bool = True
+
     # Agent models
     claude_model: str = "sonnet"
     codex_model: str = ""
@@ -57,56 +145,19 @@ class Config:
 
     webhook_port: int = 8080
     webhook_secret: str = ""
+    # Cap on webhook-triggered runs executing at once
+    max_concurrent_runs: int = 2
 
     @classmethod
     def from_env(cls) -> Config:
-        raw_repos = os.environ.get("TARGET_REPO", "")
-        repos = tuple(r.strip() for r in raw_repos.split(",") if r.strip())
-        return cls(
-            github_token=os.environ.get("GITHUB_TOKEN", ""),
-            target_repos=repos,
-            anthropic_api_key=os.environ.get("ANTHROPIC_API_KEY", ""),
-            poll_interval=int(os.environ.get("POLL_INTERVAL", "60")),
-            max_issues_per_poll=max(1, int(os.environ.get("MAX_ISSUES_PER_POLL", "1"))),
-
-            issue_label=os.environ.get("ISSUE_LABEL", "jarvis"),
-            ready_label=os.environ.get("READY_LABEL", "jarvis-ready"),
-            done_label=os.environ.get("DONE_LABEL", "jarvis-done"),
-            needs_human_label=os.environ.get("NEEDS_HUMAN_LABEL", "jarvis-needs-human"),
-
-            model_label_claude=os.environ.get("MODEL_LABEL_CLAUDE", "jarvis-cl"),
-            model_label_codex=os.environ.get("MODEL_LABEL_CODEX", "jarvis-co"),
-            model_label_gemini=os.environ.get("MODEL_LABEL_GEMINI", "jarvis-ge"),
-
-            workspace_dir=os.environ.get("WORKSPACE_DIR", "/tmp/jarvis-workspace"),
-            db_path=os.environ.get("DB_PATH", "jarvis.db"),
-            branch_prefix=os.environ.get("BRANCH_PREFIX", "jarvis/issue-"),
-
-            claude_model=os.environ.get("CLAUDE_MODEL", "sonnet"),
-            codex_model=os.environ.get("CODEX_MODEL", ""),
-            gemini_model=os.environ.get("GEMINI_MODEL", ""),
-
-            review_rounds=int(os.environ.get("REVIEW_ROUNDS", "2")),
-            reviewer_backend_order=os.environ.get("REVIEWER_BACKEND_ORDER", "claude,codex"),
-
-            test_cmd=os.environ.get("TEST_CMD", ""),
-            test_timeout_s=int(os.environ.get("TEST_TIMEOUT_S", "900")),
-
-            webhook_port=int(os.environ.get("WEBHOOK_PORT", "8080")),
-            webhook_secret=os.environ.get("WEBHOOK_SECRET", ""),
-
-            log_level=os.environ.get("LOG_LEVEL", "INFO"),
-            session_timeout=int(os.environ.get("SESSION_TIMEOUT", "7200")),
-            issue_timeout=int(os.environ.get("ISSUE_TIMEOUT", "1800")),
-            max_diff_files=int(os.environ.get("MAX_DIFF_FILES", "40")),
-            max_diff_loc=int(os.environ.get("MAX_DIFF_LOC", "1000")),
-            max_tokens_per_run=int(os.environ.get("MAX_TOKENS_PER_RUN", "180000")),
-            token_warning_buffer=int(os.environ.get("TOKEN_WARNING_BUFFER", "5000")),
-            codex_binary=os.environ.get("CODEX_BINARY", "node /usr/lib/node_modules/@openai/codex/bin/codex.js"),
-            reports_dir=os.environ.get("REPORTS_DIR", "reports"),
-            jarvis_repo_dir=os.environ.get("JARVIS_REPO_DIR", ""),
-            publish=os.environ.get("PUBLISH", "").lower() in ("true", "1", "yes"),
-        )
+        env = os.environ
+        kwargs = {
+            field: conv(env.get(key, default)) if conv is not None else env.get(key, default)
+            for field, key, default, conv in _ENV_SPEC
+        }
+        raw_repos = env.get("TARGET_REPO", "")
+        kwargs["target_repos"] = tuple(r.strip() for r in raw_repos.split(",") if r.strip())
+        return cls(**kwargs)
 
     def validate(self) -> list[str]:
         errors = []
@@ -114,9 +165,30 @@ class Config:
             errors.append("GITHUB_TOKEN is required")
         if not self.target_repos:
             errors.append("TARGET_REPO is required (comma-separated for multiple)")
-        for repo in self.target_repos:
-            if "/" not in repo:
-                errors.append(
-                    f"TARGET_REPO '{repo}' must be in owner/repo format (e.g. BrianTruong23/my-project)"
-                )
+        errors.extend(
+            f"TARGET_REPO '{repo}' must be in owner/repo format (e.g. BrianTruong23/my-project)"
+            for repo in self.target_repos
+            if not _REPO_RE.match(repo)
+        )
         return errors
+
+
+_cached_config: Config | None = None
+
+
+def get_config() -> Config:
+    """Process-wide Config singleton.
+
+    Environment variables don't change mid-process, so re-reading and
+    re-parsing 20+ of them on every call is wasted work. Tests that mutate
+    the environment should call reset_config_cache().
+    """
+    global _cached_config
+    if _cached_config is None:
+        _cached_config = Config.from_env()
+    return _cached_config
+
+
+def reset_config_cache() -> None:
+    global _cached_config
+    _cached_config = None
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import sqlite3
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 
 from jarvis.models import Run, RunStatus, Trigger
@@ -13,8 +17,8 @@ CREATE TABLE IF NOT EXISTS runs (
     issue_number INTEGER NOT NULL,
     issue_title  TEXT NOT NULL,
     repo         TEXT NOT NULL DEFAULT '',
-    status       TEXT NOT NULL DEFAULT 'pending',
-    trigger      TEXT NOT NULL,
+    status       INTEGER NOT NULL DEFAULT 0,
+    trigger      INTEGER NOT NULL,
     branch       TEXT,
     pr_url       TEXT,
     error        TEXT,
@@ -24,38 +28,148 @@ CREATE TABLE IF NOT EXISTS runs (
 );
 """
 
+# Applied after migrations so the repo column exists on legacy databases.
+INDEXES = """\
+CREATE INDEX IF NOT EXISTS idx_runs_issue_repo_status ON runs(issue_number, repo, status);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC);
+"""
+
 MIGRATIONS = [
     "ALTER TABLE runs ADD COLUMN repo TEXT NOT NULL DEFAULT '';",
     "ALTER TABLE runs ADD COLUMN agent_name TEXT;",
     "ALTER TABLE runs ADD COLUMN tokens_used INTEGER;",
 ]
 
+# Bump whenever SCHEMA/MIGRATIONS change. Stored in PRAGMA user_version so
+# startup on a current database skips the table_info probe and ALTER attempts.
+_SCHEMA_VERSION = 2
+
+# status/trigger are stored as small INTEGER codes rather than repeated TEXT:
+# cheaper index comparisons and fewer bytes per row. Codes follow enum
+# declaration order, so new members must only ever be appended.
+_STATUS_CODES = {status: code for code, status in enumerate(RunStatus)}
+_STATUS_FROM_CODE = {code: status for status, code in _STATUS_CODES.items()}
+_TRIGGER_CODES = {trigger: code for code, trigger in enumerate(Trigger)}
+_TRIGGER_FROM_CODE = {code: trigger for trigger, code in _TRIGGER_CODES.items()}
+
+
+def _decode_status(value: int | str) -> RunStatus:
+    # Legacy rows (pre-v2) hold TEXT values until _migrate converts them.
+    if isinstance(value, int):
+        return _STATUS_FROM_CODE[value]
+    return RunStatus(value)
+
+
+def _decode_trigger(value: int | str) -> Trigger:
+    if isinstance(value, int):
+        return _TRIGGER_FROM_CODE[value]
+    return Trigger(value)
+
+# INSERT/UPDATE ... RETURNING halves the statement count per write.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+
+# Statuses that block re-processing an issue. DEFERRED is intentionally
+# excluded so the next poll cycle can retry.
+_CLAIMED_STATUS_CODES = (
+    _STATUS_CODES[RunStatus.PENDING],
+    _STATUS_CODES[RunStatus.RUNNING],
+    _STATUS_CODES[RunStatus.SUCCESS],
+    _STATUS_CODES[RunStatus.NEEDS_HUMAN],
+)
+
+
+def _utcnow() -> str:
+    """Timestamp in the same format SQLite's datetime('now') emits.
+
+    Computing it in Python lets the UPDATE statement text stay constant,
+    so SQLite can serve it from its prepared-statement cache instead of
+    re-parsing the datetime() expression on every write.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(fields: tuple[str, ...], returning: bool) -> str:
+    assignments = ", ".join(f"{f} = ?" for f in fields + ("updated_at",))
+    suffix = " RETURNING *" if returning else ""
+    return f"UPDATE runs SET {assignments} WHERE id = ?{suffix}"
+
 
 class Database:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection per thread: WAL lets readers proceed
+        # alongside a writer, so poller worker threads no longer queue on a
+        # single shared connection; busy_timeout covers writer contention.
+        self._tls = threading.local()
         self._init_schema()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._tls.conn = conn
         return conn
 
+    def close(self) -> None:
+        conn = getattr(self._tls, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._tls.conn = None
+
     def _init_schema(self) -> None:
-        with self._connect() as conn:
+        with self._conn as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= _SCHEMA_VERSION:
+                return
             conn.executescript(SCHEMA)
             self._migrate(conn)
+            conn.executescript(INDEXES)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     def _migrate(self, conn: sqlite3.Connection) -> None:
-        cursor = conn.execute("PRAGMA table_info(runs)")
-        columns = {row[1] for row in cursor.fetchall()}
+        info = conn.execute("PRAGMA table_info(runs)").fetchall()
+        columns = {row[1] for row in info}
         if "repo" not in columns or "agent_name" not in columns or "tokens_used" not in columns:
             for sql in MIGRATIONS:
                 try:
                     conn.execute(sql)
                 except sqlite3.OperationalError:
                     pass
+        # v2: legacy databases declared status/trigger as TEXT. An in-place
+        # UPDATE can't fix that — TEXT affinity turns the bound integer into
+        # the string '0' — so rebuild the table under the current (INTEGER)
+        # schema and convert the values while copying.
+        column_types = {row[1]: (row[2] or "").upper() for row in info}
+        if "INT" not in column_types.get("status", "INTEGER"):
+            status_case = " ".join(f"WHEN '{s.value}' THEN {code}" for s, code in _STATUS_CODES.items())
+            trigger_case = " ".join(f"WHEN '{t.value}' THEN {code}" for t, code in _TRIGGER_CODES.items())
+            conn.execute("ALTER TABLE runs RENAME TO runs_legacy")
+            conn.executescript(SCHEMA)
+            # SCHEMA predates the ALTER-added columns; apply them to the
+            # rebuilt table before copying.
+            for sql in MIGRATIONS:
+                try:
+                    conn.execute(sql)
+                except sqlite3.OperationalError:
+                    pass
+            conn.execute(
+                "INSERT INTO runs (id, issue_number, issue_title, repo, status, trigger, branch, "
+                "pr_url, error, agent_output, agent_name, tokens_used, created_at, updated_at) "
+                "SELECT id, issue_number, issue_title, repo, "
+                f"CASE status {status_case} ELSE CAST(status AS INTEGER) END, "
+                f"CASE trigger {trigger_case} ELSE CAST(trigger AS INTEGER) END, "
+                "branch, pr_url, error, agent_output, agent_name, tokens_used, created_at, updated_at "
+                "FROM runs_legacy"
+            )
+            conn.execute("DROP TABLE runs_legacy")
 
     def _row_to_run(self, row: sqlite3.Row) -> Run:
         return Run(
@@ -63,8 +177,8 @@ class Database:
             issue_number=row["issue_number"],
             issue_title=row["issue_title"],
             repo=row["repo"],
-            status=RunStatus(row["status"]),
-            trigger=Trigger(row["trigger"]),
+            status=_decode_status(row["status"]),
+            trigger=_decode_trigger(row["trigger"]),
             branch=row["branch"],
             pr_url=row["pr_url"],
             error=row["error"],
@@ -76,12 +190,21 @@ class Database:
         )
 
     def create_run(self, issue_number: int, issue_title: str, trigger: Trigger, repo: str = "") -> Run:
-        with self._connect() as conn:
-            cursor = conn.execute(
-                "INSERT INTO runs (issue_number, issue_title, trigger, repo) VALUES (?, ?, ?, ?)",
-                (issue_number, issue_title, trigger.value, repo),
-            )
-            row = conn.execute("SELECT * FROM runs WHERE id = ?", (cursor.lastrowid,)).fetchone()
+        # status is bound explicitly so legacy databases with a TEXT default
+        # still get the integer code.
+        params = (issue_number, issue_title, _TRIGGER_CODES[trigger], repo, _STATUS_CODES[RunStatus.PENDING])
+        with self._conn as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(
+                    "INSERT INTO runs (issue_number, issue_title, trigger, repo, status) VALUES (?, ?, ?, ?, ?) RETURNING *",
+                    params,
+                ).fetchone()
+            else:
+                cursor = conn.execute(
+                    "INSERT INTO runs (issue_number, issue_title, trigger, repo, status) VALUES (?, ?, ?, ?, ?)",
+                    params,
+                )
+                row = conn.execute("SELECT * FROM runs WHERE id = ?", (cursor.lastrowid,)).fetchone()
         return self._row_to_run(row)
 
     def update_run(
@@ -96,50 +219,66 @@ class Database:
         agent_name: str | None = None,
         tokens_used: int | None = None,
     ) -> Run:
-        updates: list[str] = []
+        fields: list[str] = []
         params: list[object] = []
         if status is not None:
-            updates.append("status = ?")
-            params.append(status.value)
+            fields.append("status")
+            params.append(_STATUS_CODES[status])
         if branch is not None:
-            updates.append("branch = ?")
+            fields.append("branch")
             params.append(branch)
         if pr_url is not None:
-            updates.append("pr_url = ?")
+            fields.append("pr_url")
             params.append(pr_url)
         if error is not None:
-            updates.append("error = ?")
+            fields.append("error")
             params.append(error)
         if agent_output is not None:
-            updates.append("agent_output = ?")
+            fields.append("agent_output")
             params.append(agent_output)
         if agent_name is not None:
-            updates.append("agent_name = ?")
+            fields.append("agent_name")
             params.append(agent_name)
         if tokens_used is not None:
-            updates.append("tokens_used = ?")
+            fields.append("tokens_used")
             params.append(tokens_used)
-        if not updates:
+        if not fields:
             return self.get_run(run_id)
-        updates.append("updated_at = datetime('now')")
-        params.append(run_id)
-        with self._connect() as conn:
-            conn.execute(
-                f"UPDATE runs SET {', '.join(updates)} WHERE id = ?",
-                params,
-            )
-            row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        sql = _update_sql(tuple(fields), _HAS_RETURNING)
+        params.extend((_utcnow(), run_id))
+        with self._conn as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(sql, params).fetchone()
+            else:
+                conn.execute(sql, params)
+                row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
         return self._row_to_run(row)
 
+    @contextlib.contextmanager
+    def buffered_update(self, run_id: int):
+        """Collect update_run fields in a dict and flush them as one UPDATE.
+
+        Callers with several logically-simultaneous field changes (status +
+        error + agent_output at a checkpoint) assign into the yielded dict;
+        exit — including early return/break — issues a single transaction
+        instead of one commit per field group.
+        """
+        buf: dict[str, object] = {}
+        try:
+            yield buf
+        finally:
+            if buf:
+                self.update_run(run_id, **buf)
+
     def get_run(self, run_id: int) -> Run:
-        with self._connect() as conn:
+        with self._conn as conn:
             row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
         if row is None:
             raise ValueError(f"Run {run_id} not found")
         return self._row_to_run(row)
 
     def get_runs_for_issue(self, issue_number: int, repo: str = "") -> list[Run]:
-        with self._connect() as conn:
+        with self._conn as conn:
             if repo:
                 rows = conn.execute(
                     "SELECT * FROM runs WHERE issue_number = ? AND repo = ? ORDER BY created_at DESC",
@@ -153,30 +292,66 @@ class Database:
         return [self._row_to_run(r) for r in rows]
 
     def get_all_runs(self) -> list[Run]:
-        with self._connect() as conn:
+        with self._conn as conn:
             rows = conn.execute("SELECT * FROM runs ORDER BY created_at DESC").fetchall()
         return [self._row_to_run(r) for r in rows]
 
-    def is_issue_claimed(self, issue_number: int, repo: str = "") -> bool:
-        """Check if issue has an in-flight or terminal run.
+    def status_histogram(self) -> dict[RunStatus, int]:
+        """Run counts per status via a single grouped query.
 
-        DEFERRED is intentionally excluded so the next poll cycle can retry.
+        Summary reports only need seven counters, not every row; GROUP BY
+        keeps the scan inside SQLite and the transfer at O(statuses).
         """
-        claimed = (
-            RunStatus.PENDING.value,
-            RunStatus.RUNNING.value,
-            RunStatus.SUCCESS.value,
-            RunStatus.NEEDS_HUMAN.value,
-        )
-        with self._connect() as conn:
+        with self._conn as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM runs GROUP BY status").fetchall()
+        return {_decode_status(row[0]): row[1] for row in rows}
+
+    def count_distinct_issues(self) -> int:
+        with self._conn as conn:
+            row = conn.execute("SELECT COUNT(DISTINCT issue_number) FROM runs").fetchone()
+        return row[0]
+
+    def recent_by_status(self, status: RunStatus, limit: int = 5) -> list[Run]:
+        """Most recent runs with the given status, newest first."""
+        with self._conn as conn:
+            rows = conn.execute(
+                "SELECT * FROM runs WHERE status = ? ORDER BY id DESC LIMIT ?",
+                (_STATUS_CODES[status], limit),
+            ).fetchall()
+        return [self._row_to_run(r) for r in rows]
+
+    def get_claimed_issue_numbers(self, repo: str = "") -> set[int]:
+        """All issue numbers with an in-flight or terminal run, in one query.
+
+        Poll loops should prefer this over per-issue is_issue_claimed calls:
+        one statement instead of N, then O(1) set membership.
+        """
+        claimed = _CLAIMED_STATUS_CODES
+        with self._conn as conn:
+            if repo:
+                rows = conn.execute(
+                    "SELECT DISTINCT issue_number FROM runs WHERE repo = ? AND status IN (?, ?, ?, ?)",
+                    (repo, *claimed),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT DISTINCT issue_number FROM runs WHERE status IN (?, ?, ?, ?)",
+                    claimed,
+                ).fetchall()
+        return {row[0] for row in rows}
+
+    def is_issue_claimed(self, issue_number: int, repo: str = "") -> bool:
+        """Check if issue has an in-flight or terminal run."""
+        claimed = _CLAIMED_STATUS_CODES
+        with self._conn as conn:
             if repo:
                 row = conn.execute(
-                    "SELECT COUNT(*) as cnt FROM runs WHERE issue_number = ? AND repo = ? AND status IN (?, ?, ?, ?)",
+                    "SELECT 1 FROM runs WHERE issue_number = ? AND repo = ? AND status IN (?, ?, ?, ?) LIMIT 1",
                     (issue_number, repo, *claimed),
                 ).fetchone()
             else:
                 row = conn.execute(
-                    "SELECT COUNT(*) as cnt FROM runs WHERE issue_number = ? AND status IN (?, ?, ?, ?)",
+                    "SELECT 1 FROM runs WHERE issue_number = ? AND status IN (?, ?, ?, ?) LIMIT 1",
                     (issue_number, *claimed),
                 ).fetchone()
-        return row["cnt"] > 0
+        return row is not None
@@ -1,4 +1,10 @@
-"""Data models for Jarvis22."""
+"""Data models for Jarvis22.
+
+Plain dataclasses with slots=True, deliberately not msgspec/pydantic:
+PyGithub is the project's single external dependency, and slotted
+dataclasses already give fixed-layout attribute storage without dict
+overhead for these small, frequently-created records.
+"""
 
 from __future__ import annotations
 
@@ -25,16 +31,28 @@ class Trigger(str, Enum):
     WEBHOOK = "webhook"
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueContext:
     number: int
     title: str
     body: str
     repo: str = ""
     labels: list[str] = field(default_factory=list)
+    # Lazily-computed membership view of labels; slots preclude cached_property.
+    _labels_lower: frozenset[str] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def labels_text(self) -> str:
+        return ", ".join(self.labels) if self.labels else "(none)"
+
+    @property
+    def labels_lower(self) -> frozenset[str]:
+        if self._labels_lower is None:
+            self._labels_lower = frozenset(l.lower() for l in self.labels)
+        return self._labels_lower
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     output: str
     agent_name: str
@@ -45,7 +63,7 @@ class AgentResult:
     rate_limited: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Run:
     id: int | None
     issue_number: int
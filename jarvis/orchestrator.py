@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
+import subprocess
+import threading
+from pathlib import Path
 
 from jarvis.agent import (
     AgentUnavailableError,
     backend_order,
+    close_workers_for,
     implementer_prompt,
     parse_reviewer_verdict,
     reviewer_backend_order,
     reviewer_prompt,
     run_backend,
+    run_backends_hedged,
 )
 from jarvis.config import Config
 from jarvis.db import Database
-from jarvis.github_client import GitHubClient
+from jarvis.github_client import GitHubClient, fetch_labeled_issues_batch
 from jarvis.models import IssueContext, RunStatus, Trigger
 from jarvis.report import format_failure_comment
 from jarvis.workspace import Workspace
@@ -24,10 +30,66 @@ log = logging.getLogger(__name__)
 
 
 def _truncate(s: str, max_chars: int = 8000) -> str:
-    s = (s or "").strip()
+    if not s:
+        return ""
     if len(s) <= max_chars:
-        return s
-    return s[:max_chars] + "\n\n...(truncated)"
+        return s.strip()
+    # Slice before stripping so strip never scans more than max_chars;
+    # the old strip-then-slice walked the full (possibly huge) string.
+    return s[:max_chars].strip() + "\n\n...(truncated)"
+
+
+# Module-level templates: shared with _PR_BODY_TEMPLATE below, and the one
+# place to touch if commit/PR wording ever becomes configurable.
+_PR_TITLE_TEMPLATE = "fix: resolve #{number} — {title}"
+_COMMIT_PASS1_TEMPLATE = "jarvis: pass 1 implement — issue #{number}"
+_COMMIT_REVIEW_TEMPLATE = "jarvis: pass {n} address review — issue #{number}"
+_PR_BODY_TEMPLATE = "Closes #{number}\n\n## Agent output\n\n```\n{output}\n```\n"
+
+
+# Combined output beyond this spills to a log file; only a head+tail
+# excerpt lands in the runs row. Verbose agents can emit MBs, and the row
+# is rewritten at every checkpoint.
+_DB_OUTPUT_LIMIT = 64_000
+_DB_OUTPUT_HEAD = 50_000
+_DB_OUTPUT_TAIL = 10_000
+
+
+class _OutputParts(list):
+    """Output accumulator with a cached join.
+
+    The combined output is re-serialized to the DB at several checkpoints per
+    issue; joining tens of KB from scratch each time is quadratic over the
+    review loop. The cache invalidates on append and re-joins only when parts
+    actually changed.
+    """
+
+    __slots__ = ("_joined",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._joined: str | None = None
+
+    def append(self, part: str) -> None:
+        super().append(part)
+        self._joined = None
+
+    def text(self) -> str:
+        if self._joined is None:
+            self._joined = "\n\n".join(self)
+        return self._joined
+
+
+def _run_concurrently(*calls) -> None:
+    """Run independent I/O-bound calls in parallel and wait for all of them.
+
+    Used for label swaps + final comments at the end of a run: each is its
+    own HTTPS round-trip with no ordering dependency, so serializing them
+    just adds latency. Exceptions propagate from the first failing call.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        for future in [pool.submit(c) for c in calls]:
+            future.result()
 
 
 class RepoHandler:
@@ -37,57 +99,94 @@ class RepoHandler:
         self.repo_name = repo_name
         self.gh = GitHubClient(config, repo_name)
         self.workspace = Workspace(config, self.gh.clone_url, repo_name)
+        # Serializes fetch + worktree add/remove on the shared clone; issue
+        # processing itself runs in per-issue worktrees and needs no lock.
+        self.lock = threading.Lock()
 
 
 class Orchestrator:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.db = Database(config.db_path)
+        # Handlers are created lazily by _get_handler: constructing one hits
+        # the GitHub API, so startup shouldn't pay for repos that never see
+        # a labeled issue.
         self._handlers: dict[str, RepoHandler] = {}
-        for repo in config.target_repos:
-            self._handlers[repo] = RepoHandler(config, repo)
+        self._handlers_lock = threading.Lock()
+
+        # Built once: the label policy is fixed for the life of the process,
+        # and should_process runs inside the per-issue poll loop.
+        self._allowed_labels = frozenset(
+            label.lower()
+            for label in (
+                config.issue_label,
+                config.model_label_claude,
+                config.model_label_codex,
+                config.model_label_gemini,
+            )
+        )
 
         self._claude_unavailable_recently = False
 
+        # Set by the webhook handler when a labeled event arrives so the
+        # poller can cut its sleep short instead of waiting out the full
+        # (possibly backed-off) interval.
+        self._wake = threading.Event()
+
+        # Warm the git binary (ld.so resolution + paging in git/libcurl)
+        # during startup so the first issue doesn't pay it mid-run.
+        try:
+            subprocess.run(["git", "--version"], capture_output=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
     @property
     def claude_unavailable_recently(self) -> bool:
         return self._claude_unavailable_recently
 
+    def wake(self) -> None:
+        """Interrupt the poller's current sleep (see run_poller)."""
+        self._wake.set()
+
     def _get_handler(self, repo_name: str) -> RepoHandler:
-        if repo_name not in self._handlers:
-            self._handlers[repo_name] = RepoHandler(self.config, repo_name)
-        return self._handlers[repo_name]
+        # Worker threads can race to create a handler for an unseen repo;
+        # the lock keeps construction (network calls included) single-shot.
+        with self._handlers_lock:
+            if repo_name not in self._handlers:
+                self._handlers[repo_name] = RepoHandler(self.config, repo_name)
+            return self._handlers[repo_name]
 
     def should_process(self, issue: IssueContext, trigger: Trigger) -> bool:
-        labels = {l.lower() for l in issue.labels}
-        allowed = {
-            self.config.issue_label.lower(),
-            self.config.model_label_claude.lower(),
-            self.config.model_label_codex.lower(),
-            self.config.model_label_gemini.lower(),
-        }
-        return bool(labels.intersection(allowed))
+        return not issue.labels_lower.isdisjoint(self._allowed_labels)
 
     def _run_implementer_until_changes(
         self,
-        handler: RepoHandler,
+        workspace: Workspace,
         issue: IssueContext,
         extra_instructions: str,
-        combined_output_parts: list[str],
+        combined_output_parts: _OutputParts,
     ) -> tuple[bool, bool]:
         """Returns (has_changes, any_unavailable)."""
         any_unavailable = False
         prompt = implementer_prompt(issue, extra_instructions=extra_instructions)
 
-        for backend in backend_order(self.config, issue):
+        order = backend_order(self.config, issue)
+        if self._claude_unavailable_recently and "claude" in order and len(order) > 1:
+            # Claude failed on a recent call (rate limit/auth); demote it so
+            # the likely-working backend runs first instead of waiting out
+            # another failure. It stays in the list so a success can reset
+            # the flag.
+            order = [b for b in order if b != "claude"] + ["claude"]
+
+        for backend in order:
             try:
-                out = run_backend(self.config, handler.workspace.repo_dir, backend, prompt)
+                out = run_backend(self.config, workspace.repo_dir, backend, prompt)
                 combined_output_parts.append(f"[implementer:{backend}]\n{out}")
 
                 if backend == "claude":
                     self._claude_unavailable_recently = False
 
-                if handler.workspace.has_changes():
+                if workspace.has_changes():
                     log.info("[%s] Implementer produced changes using %s", issue.repo, backend)
                     return True, any_unavailable
 
@@ -100,33 +199,74 @@ class Orchestrator:
                     self._claude_unavailable_recently = True
                 continue
 
-        return handler.workspace.has_changes(), any_unavailable
+        return workspace.has_changes(), any_unavailable
 
     def _run_reviewer(
         self,
-        handler: RepoHandler,
+        workspace: Workspace,
         issue: IssueContext,
         round_num: int,
         test_output: str,
-        combined_output_parts: list[str],
+        combined_output_parts: _OutputParts,
+        cache: dict | None = None,
     ) -> tuple[str, str]:
-        diffstat = handler.workspace.diffstat()
-        diff = handler.workspace.diff()
-        prompt = reviewer_prompt(issue, diffstat=diffstat, diff=diff, test_output=test_output)
+        diffstat, diff = workspace.diff_with_stat()
+
+        # If neither the diff nor the test output changed since the previous
+        # round, the reviewer would see an identical prompt — reuse its
+        # verdict instead of paying another LLM call.
+        key = (diff, test_output)
+        if cache is not None and cache.get("key") == key:
+            combined_output_parts.append(
+                f"[reviewer:round{round_num}]\n(unchanged diff and tests; reusing round {cache['round']} verdict)"
+            )
+            return cache["verdict"], cache["normalized"]
 
-        last_err = ""
-        for backend in reviewer_backend_order(self.config, issue):
-            try:
-                out = run_backend(self.config, handler.workspace.repo_dir, backend, prompt)
-                combined_output_parts.append(f"[reviewer:{backend}:round{round_num}]\n{out}")
-                verdict, normalized = parse_reviewer_verdict(out)
-                return verdict, normalized
-            except AgentUnavailableError as e:
-                last_err = str(e)
-                combined_output_parts.append(f"[reviewer:{backend}:round{round_num}]\nUNAVAILABLE: {e}")
-                continue
+        prompt = reviewer_prompt(issue, diffstat=diffstat, diff=diff, test_output=test_output)
 
-        return "CHANGES_REQUESTED", f"VERDICT: CHANGES_REQUESTED\nSUMMARY: Reviewer backend unavailable\nNOTES:\n- {last_err or 'all reviewer backends unavailable'}\nTESTING:\n- (none)"
+        # Reviewing is read-only, so all reviewer backends race concurrently
+        # and the first success wins instead of waiting out a slow fallback chain.
+        try:
+            backend, out = run_backends_hedged(
+                self.config,
+                workspace.repo_dir,
+                reviewer_backend_order(self.config, issue),
+                prompt,
+            )
+        except AgentUnavailableError as e:
+            combined_output_parts.append(f"[reviewer:round{round_num}]\nUNAVAILABLE: {e}")
+            return "CHANGES_REQUESTED", f"VERDICT: CHANGES_REQUESTED\nSUMMARY: Reviewer backend unavailable\nNOTES:\n- {e}\nTESTING:\n- (none)"
+
+        combined_output_parts.append(f"[reviewer:{backend}:round{round_num}]\n{out}")
+        verdict, normalized = parse_reviewer_verdict(out)
+        if cache is not None:
+            cache.update(key=key, round=round_num, verdict=verdict, normalized=normalized)
+        return verdict, normalized
+
+    def _persist_output(self, run_id: int, parts: _OutputParts) -> str:
+        """Return the agent output to store in the DB, spilling to disk if large.
+
+        Small outputs go into the row verbatim. Oversized ones are written in
+        full to reports/run-<id>.log and the row keeps a head+tail excerpt
+        with a pointer — keeping the row (rewritten at every checkpoint) and
+        resident memory bounded regardless of agent verbosity.
+        """
+        text = parts.text()
+        if len(text) <= _DB_OUTPUT_LIMIT:
+            return text
+        # Same base as write_report_file/commit_reports, so the spill log
+        # lands inside the committed reports tree rather than wherever the
+        # daemon happened to be started.
+        repo_dir = Path(self.config.jarvis_repo_dir) if self.config.jarvis_repo_dir else Path.cwd()
+        path = repo_dir / self.config.reports_dir / f"run-{run_id}.log"
+        pointer = ""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+            pointer = f"(full output: {path})\n\n"
+        except OSError:
+            log.exception("Failed to write run output log for run %d", run_id)
+        return pointer + text[:_DB_OUTPUT_HEAD] + "\n\n...(truncated)...\n\n" + text[-_DB_OUTPUT_TAIL:]
 
     def process_issue(self, issue: IssueContext, trigger: Trigger) -> None:
         handler = self._get_handler(issue.repo)
@@ -134,50 +274,71 @@ class Orchestrator:
         run_id = run.id
         branch = handler.workspace.branch_name(issue.number)
 
-        combined_output_parts: list[str] = []
+        combined_output_parts = _OutputParts()
+        ws: Workspace | None = None
 
         try:
             self.db.update_run(run_id, status=RunStatus.RUNNING, branch=branch)
 
-            # Setup workspace
-            handler.workspace.ensure_repo()
-            handler.workspace.create_branch(branch)
+            # Setup workspace: each issue gets its own worktree sharing the
+            # persistent clone's object store, so only fetch + worktree
+            # creation need the per-repo lock.
+            with handler.lock:
+                handler.workspace.ensure_repo()
+                ws = handler.workspace.worktree_for(branch)
 
             # Implementer pass 1
             has_changes, any_unavailable = self._run_implementer_until_changes(
-                handler,
+                ws,
                 issue,
                 extra_instructions="",
                 combined_output_parts=combined_output_parts,
             )
-            self.db.update_run(run_id, agent_output="\n\n".join(combined_output_parts))
 
+            # Coalesce the output write with the terminal status where the
+            # run ends here — one transaction instead of two.
             if not has_changes:
                 if any_unavailable:
                     self.db.update_run(
                         run_id,
                         status=RunStatus.DEFERRED,
                         error="No backend produced changes (some backends unavailable); will retry.",
+                        agent_output=self._persist_output(run_id, combined_output_parts),
                     )
                     return
 
-                self.db.update_run(run_id, status=RunStatus.FAILED, error="Agent produced no file changes")
+                self.db.update_run(
+                    run_id,
+                    status=RunStatus.FAILED,
+                    error="Agent produced no file changes",
+                    agent_output=self._persist_output(run_id, combined_output_parts),
+                )
                 handler.gh.comment_on_issue(issue.number, format_failure_comment(issue.number, "Agent produced no file changes"))
                 return
 
+            self.db.update_run(run_id, agent_output=self._persist_output(run_id, combined_output_parts))
+
+            # Guardrail: refuse to push runaway diffs.
+            within_limits, diff_detail = ws.check_diff_limits(self.config.max_diff_files, self.config.max_diff_loc)
+            if not within_limits:
+                error = f"Diff exceeds limits: {diff_detail}"
+                self.db.update_run(run_id, status=RunStatus.BLOCKED, error=error)
+                handler.gh.comment_on_issue(issue.number, format_failure_comment(issue.number, error))
+                return
+
             # Commit + push + PR
-            commit_msg = f"jarvis: pass 1 implement — issue #{issue.number}"
-            pushed = handler.workspace.commit_and_push(branch, commit_msg)
+            commit_msg = _COMMIT_PASS1_TEMPLATE.format(number=issue.number)
+            pushed = ws.commit_and_push(branch, commit_msg)
             if not pushed:
                 self.db.update_run(run_id, status=RunStatus.FAILED, error="Agent produced no file changes")
                 handler.gh.comment_on_issue(issue.number, format_failure_comment(issue.number, "Agent produced no file changes"))
                 return
 
-            pr_body = _truncate("\n\n".join(combined_output_parts), 3000)
+            pr_body = _truncate(combined_output_parts.text(), 3000)
             pr_url = handler.gh.create_pr(
                 branch=branch,
-                title=f"fix: resolve #{issue.number} — {issue.title}",
-                body=f"Closes #{issue.number}\n\n## Agent output\n\n```\n{pr_body}\n```\n",
+                title=_PR_TITLE_TEMPLATE.format(number=issue.number, title=issue.title),
+                body=_PR_BODY_TEMPLATE.format(number=issue.number, output=pr_body),
             )
 
             handler.gh.comment_on_issue(
@@ -191,77 +352,88 @@ class Orchestrator:
             # Review loop: up to N rounds, but only 2 by default.
             feedback_text = ""
             approved = False
+            review_cache: dict = {}
             for r in range(1, max(1, self.config.review_rounds) + 1):
-                test_res = handler.workspace.run_test_cmd(self.config.test_cmd, self.config.test_timeout_s)
-                test_out = f"CMD: {test_res.cmd}\nEXIT: {test_res.exit_code}\nSTDOUT:\n{test_res.stdout}\nSTDERR:\n{test_res.stderr}"
-                test_out_short = _truncate(test_out, 12000)
-
-                verdict, review_text = self._run_reviewer(
-                    handler,
-                    issue,
-                    round_num=r,
-                    test_output=test_out_short,
-                    combined_output_parts=combined_output_parts,
-                )
-                self.db.update_run(run_id, agent_output="\n\n".join(combined_output_parts))
-
-                handler.gh.comment_on_issue(
-                    issue.number,
-                    _truncate(
-                        f"Jarvis22 reviewer round {r}:\n\n```\n{_truncate(review_text, 12000)}\n```\n\nTest output (truncated):\n\n```\n{_truncate(test_out_short, 12000)}\n```",
-                        15000,
-                    ),
-                )
+                # One DB transaction per round: reviewer and implementer
+                # output both land in the buffer, flushed at round exit.
+                with self.db.buffered_update(run_id) as buf:
+                    test_res = ws.run_test_cmd(self.config.test_cmd, self.config.test_timeout_s)
+                    test_out = f"CMD: {test_res.cmd}\nEXIT: {test_res.exit_code}\nSTDOUT:\n{test_res.stdout}\nSTDERR:\n{test_res.stderr}"
+                    test_out_short = _truncate(test_out, 12000)
+
+                    verdict, review_text = self._run_reviewer(
+                        ws,
+                        issue,
+                        round_num=r,
+                        test_output=test_out_short,
+                        combined_output_parts=combined_output_parts,
+                        cache=review_cache,
+                    )
+                    buf["agent_output"] = self._persist_output(run_id, combined_output_parts)
 
-                if verdict == "APPROVE":
-                    approved = True
-                    break
+                    # One comment edited per round instead of a new POST each
+                    # time — fewer API calls, no repeat notifications.
+                    handler.gh.upsert_progress_comment(
+                        issue.number,
+                        _truncate(
+                            f"Jarvis22 reviewer round {r}:\n\n```\n{_truncate(review_text, 12000)}\n```\n\nTest output (truncated):\n\n```\n{_truncate(test_out_short, 12000)}\n```",
+                            15000,
+                        ),
+                        key="review-progress",
+                    )
 
-                feedback_text = review_text
+                    if verdict == "APPROVE":
+                        approved = True
+                        break
 
-                # Implementer addresses feedback
-                has_changes2, any_unavailable2 = self._run_implementer_until_changes(
-                    handler,
-                    issue,
-                    extra_instructions=f"Address the following review feedback:\n\n{feedback_text}",
-                    combined_output_parts=combined_output_parts,
-                )
-                self.db.update_run(run_id, agent_output="\n\n".join(combined_output_parts))
-
-                if not has_changes2:
-                    if any_unavailable2:
-                        self.db.update_run(
-                            run_id,
-                            status=RunStatus.DEFERRED,
-                            error="Could not address review (backends unavailable); will retry.",
-                        )
-                        return
-
-                pushed2 = handler.workspace.commit_and_push(branch, f"jarvis: pass {r + 1} address review — issue #{issue.number}")
+                    feedback_text = review_text
+
+                    # Implementer addresses feedback
+                    has_changes2, any_unavailable2 = self._run_implementer_until_changes(
+                        ws,
+                        issue,
+                        extra_instructions=f"Address the following review feedback:\n\n{feedback_text}",
+                        combined_output_parts=combined_output_parts,
+                    )
+                    buf["agent_output"] = self._persist_output(run_id, combined_output_parts)
+
+                    if not has_changes2:
+                        if any_unavailable2:
+                            buf["status"] = RunStatus.DEFERRED
+                            buf["error"] = "Could not address review (backends unavailable); will retry."
+                            return
+                        # Nothing new to commit; skip the push attempt and
+                        # let the next round's cached review resolve the run.
+                        continue
+
+                pushed2 = ws.commit_and_push(branch, _COMMIT_REVIEW_TEMPLATE.format(n=r + 1, number=issue.number))
                 if pushed2:
-                    handler.gh.comment_on_issue(
+                    handler.gh.upsert_progress_comment(
                         issue.number,
                         _truncate(
                             f"Jarvis22 implementer updated the branch after reviewer round {r}.\n\nPR: {pr_url}\n\nImplementer output (latest):\n\n```\n{_truncate(combined_output_parts[-1], 8000)}\n```",
                             12000,
                         ),
+                        key="implementer-progress",
                     )
 
             if approved:
                 self.db.update_run(run_id, status=RunStatus.SUCCESS, pr_url=pr_url)
-                handler.gh.mark_done(issue.number)
-                handler.gh.comment_on_issue(issue.number, f"Jarvis22: approved. PR: {pr_url}")
+                _run_concurrently(
+                    lambda: handler.gh.mark_done(issue.number),
+                    lambda: handler.gh.comment_on_issue(issue.number, f"Jarvis22: approved. PR: {pr_url}"),
+                )
                 return
 
             # Not approved after max rounds
             self.db.update_run(run_id, status=RunStatus.NEEDS_HUMAN, pr_url=pr_url, error="Review not approved")
-            handler.gh.mark_needs_human(issue.number)
-            handler.gh.comment_on_issue(
-                issue.number,
-                _truncate(
-                    f"Jarvis22: reviewer did not approve after {self.config.review_rounds} rounds. Marking needs human.\n\nPR: {pr_url}\n\nLast feedback:\n\n```\n{_truncate(feedback_text, 12000)}\n```",
-                    15000,
-                ),
+            final_comment = _truncate(
+                f"Jarvis22: reviewer did not approve after {self.config.review_rounds} rounds. Marking needs human.\n\nPR: {pr_url}\n\nLast feedback:\n\n```\n{_truncate(feedback_text, 12000)}\n```",
+                15000,
+            )
+            _run_concurrently(
+                lambda: handler.gh.mark_needs_human(issue.number),
+                lambda: handler.gh.comment_on_issue(issue.number, final_comment),
             )
 
         except Exception as e:
@@ -272,29 +444,103 @@ class Orchestrator:
                 handler.gh.comment_on_issue(issue.number, format_failure_comment(issue.number, error_msg))
             except Exception:
                 log.exception("[%s] Failed to comment on issue #%d", issue.repo, issue.number)
+        finally:
+            if ws is not None:
+                # The pooled agent worker's cwd is this worktree; close it
+                # before the tree goes away so the process doesn't outlive
+                # the directory — and so a retry on the same branch spawns a
+                # fresh worker instead of reusing one rooted in a deleted path.
+                close_workers_for(ws.repo_dir)
+                try:
+                    with handler.lock:
+                        handler.workspace.release_worktree(ws)
+                except Exception:
+                    log.exception("[%s] Failed to remove worktree for issue #%d", issue.repo, issue.number)
+
+    def _fetch_labeled_issues(self) -> dict[str, list[IssueContext]]:
+        """Fetch open labeled issues for every repo, concurrently when several are configured.
+
+        Listing is a socket-bound HTTPS round-trip per repo, so total fetch
+        latency drops from the sum of the per-repo calls to the slowest one.
+        """
+        def fetch(repo_name: str) -> list[IssueContext]:
+            # _get_handler inside the worker keeps handler construction lazy.
+            return self._get_handler(repo_name).gh.get_labeled_issues()
+
+        repos = list(self.config.target_repos)
+        if len(repos) > 1:
+            # One aliased GraphQL query covers every repo; fall back to the
+            # per-repo fan-out if it fails.
+            labels = (
+                self.config.issue_label,
+                self.config.model_label_claude,
+                self.config.model_label_codex,
+                self.config.model_label_gemini,
+            )
+            try:
+                return fetch_labeled_issues_batch(self.config, tuple(repos), labels)
+            except Exception as e:
+                log.warning("Batched issue fetch failed (%s); falling back to per-repo", e)
+
+        if len(repos) <= 1:
+            results = {}
+            for repo_name in repos:
+                try:
+                    results[repo_name] = fetch(repo_name)
+                except Exception:
+                    log.exception("Failed to fetch issues from %s", repo_name)
+                    results[repo_name] = []
+            return results
+
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(repos)) as pool:
+            futures = {repo_name: pool.submit(fetch, repo_name) for repo_name in repos}
+            for repo_name, future in futures.items():
+                try:
+                    results[repo_name] = future.result()
+                except Exception:
+                    log.exception("Failed to fetch issues from %s", repo_name)
+                    results[repo_name] = []
+        return results
 
     def poll_once(self, trigger: Trigger = Trigger.POLL) -> int:
-        processed = 0
+        candidates: list[IssueContext] = []
 
-        for repo_name, handler in self._handlers.items():
-            try:
-                issues = handler.gh.get_labeled_issues()
-            except Exception:
-                log.exception("Failed to fetch issues from %s", repo_name)
-                issues = []
+        for repo_name, issues in self._fetch_labeled_issues().items():
+            if len(candidates) >= self.config.max_issues_per_poll:
+                break
 
+            # One bulk query per repo instead of an is_issue_claimed round-trip
+            # per candidate issue.
+            claimed = self.db.get_claimed_issue_numbers(repo=repo_name)
             for issue in issues:
-                if processed >= self.config.max_issues_per_poll:
-                    return processed
-                if self.db.is_issue_claimed(issue.number, repo=repo_name):
+                if len(candidates) >= self.config.max_issues_per_poll:
+                    break
+                if issue.number in claimed:
                     continue
                 if not self.should_process(issue, trigger):
                     continue
-                log.info("[%s] Processing issue #%d: %s", repo_name, issue.number, issue.title)
-                self.process_issue(issue, trigger)
-                processed += 1
+                candidates.append(issue)
 
-        return processed
+        if not candidates:
+            return 0
+
+        for issue in candidates:
+            log.info("[%s] Processing issue #%d: %s", issue.repo, issue.number, issue.title)
+
+        workers = min(max(1, self.config.poll_concurrency), len(candidates))
+        if workers == 1:
+            for issue in candidates:
+                self.process_issue(issue, trigger)
+        else:
+            # Issue processing is subprocess-bound (agent + git), so threads
+            # overlap the waiting; per-issue worktrees keep checkouts isolated.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self.process_issue, issue, trigger) for issue in candidates]
+                for f in futures:
+                    f.result()
+
+        return len(candidates)
 
     def run_single(self, issue_number: int, repo_name: str, trigger: Trigger = Trigger.CLI) -> None:
         handler = self._get_handler(repo_name)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import time
 
 from jarvis.config import Config
 from jarvis.orchestrator import Orchestrator
@@ -25,20 +24,34 @@ def run_poller(config: Config) -> None:
         config.max_issues_per_poll,
     )
 
+    idle_cycles = 0
     while True:
         try:
             count = orch.poll_once()
             if count:
                 log.info("Processed %d issue(s) across repos", count)
+                idle_cycles = 0
             else:
                 log.debug("No new issues found")
+                idle_cycles += 1
         except KeyboardInterrupt:
             log.info("Poller stopped by user")
             break
         except Exception:
             log.exception("Error during poll cycle")
+            idle_cycles += 1
 
         # If Claude was unavailable recently, poll more frequently so we start
-        # work quickly after limits are restored.
-        sleep_s = 10 if orch.claude_unavailable_recently else config.poll_interval
-        time.sleep(sleep_s)
+        # work quickly after limits are restored. Otherwise back off
+        # exponentially over consecutive empty cycles — most polls find
+        # nothing, and fewer cycles directly saves rate-limit budget — and
+        # snap back to the base interval as soon as work appears.
+        if orch.claude_unavailable_recently:
+            sleep_s = 10
+        else:
+            sleep_s = min(config.poll_interval * (1 << min(idle_cycles, 6)), config.max_poll_interval)
+        # Event.wait instead of time.sleep so orch.wake() (e.g. from the
+        # webhook handler) starts the next cycle immediately.
+        if orch._wake.wait(timeout=sleep_s):
+            orch._wake.clear()
+            idle_cycles = 0
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import subprocess
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -13,50 +14,82 @@ from jarvis.models import AgentResult, Run, RunStatus
 
 log = logging.getLogger(__name__)
 
+# Rendering lookup tables, built once at import instead of per report call.
+_STATUS_ICON = {"success": "+", "failed": "x", "running": "~", "pending": "?", "timeout": "T", "blocked": "B"}
+# Fixed report headers as single templates: one format call and one string
+# per header instead of half a dozen f-string allocations each.
+_RUN_REPORT_HEADER = """\
+# Run Report: Issue #{number}
+
+**Title:** {title}
+**Repo:** {repo}
+**Status:** {status}
+**Generated:** {generated}"""
+
+_SESSION_REPORT_HEADER = """\
+# Session Report
+
+**Date:** {date}
+**Issues processed:** {processed}
+**Success:** {success} | **Failed:** {failed} | **Timeout:** {timeout} | **Blocked:** {blocked}
+
+## Issues"""
+
+_STATUS_LABEL = {
+    RunStatus.SUCCESS: "Completed",
+    RunStatus.FAILED: "Failed",
+    RunStatus.TIMEOUT: "Timed out",
+    RunStatus.BLOCKED: "Blocked",
+    RunStatus.RUNNING: "In progress",
+    RunStatus.PENDING: "Pending",
+}
+
 
 def format_summary_report(db: Database) -> str:
-    runs = db.get_all_runs()
-    if not runs:
+    # Aggregate in SQL: the counters come back as a handful of grouped rows
+    # and only the ten excerpted runs are materialized, instead of pulling
+    # the whole (ever-growing) runs table into Python.
+    counts = db.status_histogram()
+    total = sum(counts.values())
+    if not total:
         return "No runs recorded yet."
 
-    total = len(runs)
-    success = sum(1 for r in runs if r.status == RunStatus.SUCCESS)
-    failed = sum(1 for r in runs if r.status == RunStatus.FAILED)
-    running = sum(1 for r in runs if r.status == RunStatus.RUNNING)
-    pending = sum(1 for r in runs if r.status == RunStatus.PENDING)
-    timeout = sum(1 for r in runs if r.status == RunStatus.TIMEOUT)
-    blocked = sum(1 for r in runs if r.status == RunStatus.BLOCKED)
-    rate = (success / total * 100) if total > 0 else 0
-
-    unique_issues = len({r.issue_number for r in runs})
-
-    lines = [
-        "# Jarvis22 Run Report",
-        "",
-        f"**Total runs:** {total}",
-        f"**Unique issues:** {unique_issues}",
-        f"**Success:** {success} | **Failed:** {failed} | **Timeout:** {timeout} | **Blocked:** {blocked} | **Running:** {running} | **Pending:** {pending}",
-        f"**Success rate:** {rate:.1f}%",
-    ]
-
-    # Recent failures
-    failures = [r for r in runs if r.status == RunStatus.FAILED][:5]
-    if failures:
-        lines.append("")
-        lines.append("## Recent Failures")
-        for r in failures:
-            error_excerpt = (r.error or "unknown")[:100]
-            lines.append(f"- Issue #{r.issue_number} ({r.issue_title}): {error_excerpt}")
-
-    # Recent successes
-    successes = [r for r in runs if r.status == RunStatus.SUCCESS][:5]
-    if successes:
-        lines.append("")
-        lines.append("## Recent Successes")
-        for r in successes:
-            lines.append(f"- Issue #{r.issue_number} ({r.issue_title}): {r.pr_url or 'no PR'}")
-
-    return "\n".join(lines)
+    success = counts.get(RunStatus.SUCCESS, 0)
+    failed = counts.get(RunStatus.FAILED, 0)
+    running = counts.get(RunStatus.RUNNING, 0)
+    pending = counts.get(RunStatus.PENDING, 0)
+    timeout = counts.get(RunStatus.TIMEOUT, 0)
+    blocked = counts.get(RunStatus.BLOCKED, 0)
+    rate = success / total * 100
+
+    unique_issues = db.count_distinct_issues()
+    failures = db.recent_by_status(RunStatus.FAILED, 5)
+    successes = db.recent_by_status(RunStatus.SUCCESS, 5)
+
+    # Report bodies are emitted as generators feeding str.join directly, so
+    # there is no intermediate lines list to grow and manage per builder.
+    def emit():
+        yield "# Jarvis22 Run Report"
+        yield ""
+        yield f"**Total runs:** {total}"
+        yield f"**Unique issues:** {unique_issues}"
+        yield f"**Success:** {success} | **Failed:** {failed} | **Timeout:** {timeout} | **Blocked:** {blocked} | **Running:** {running} | **Pending:** {pending}"
+        yield f"**Success rate:** {rate:.1f}%"
+
+        if failures:
+            yield ""
+            yield "## Recent Failures"
+            for r in failures:
+                error_excerpt = (r.error or "unknown")[:100]
+                yield f"- Issue #{r.issue_number} ({r.issue_title}): {error_excerpt}"
+
+        if successes:
+            yield ""
+            yield "## Recent Successes"
+            for r in successes:
+                yield f"- Issue #{r.issue_number} ({r.issue_title}): {r.pr_url or 'no PR'}"
+
+    return "\n".join(emit())
 
 
 def format_issue_report(db: Database, issue_number: int) -> str:
@@ -64,31 +97,29 @@ def format_issue_report(db: Database, issue_number: int) -> str:
     if not runs:
         return f"No runs found for issue #{issue_number}."
 
-    lines = [
-        f"# Report for Issue #{issue_number}",
-        f"**Title:** {runs[0].issue_title}",
-        f"**Total attempts:** {len(runs)}",
-        "",
-        "## Run History",
-    ]
-
-    for r in runs:
-        status_icon = {"success": "+", "failed": "x", "running": "~", "pending": "?", "timeout": "T", "blocked": "B"}
-        icon = status_icon.get(r.status.value, "?")
-        lines.append(f"  [{icon}] Run #{r.id} ({r.status.value}) — {r.created_at}")
-        if r.agent_name:
-            lines.append(f"      Agent: {r.agent_name}")
-        if r.tokens_used:
-            lines.append(f"      Tokens: {r.tokens_used}")
-        if r.pr_url:
-            lines.append(f"      PR: {r.pr_url}")
-        if r.error:
-            lines.append(f"      Error: {r.error[:200]}")
-        if r.agent_output:
-            excerpt = r.agent_output[:200].replace("\n", " ")
-            lines.append(f"      Output: {excerpt}...")
-
-    return "\n".join(lines)
+    def emit():
+        yield f"# Report for Issue #{issue_number}"
+        yield f"**Title:** {runs[0].issue_title}"
+        yield f"**Total attempts:** {len(runs)}"
+        yield ""
+        yield "## Run History"
+
+        for r in runs:
+            icon = _STATUS_ICON.get(r.status.value, "?")
+            yield f"  [{icon}] Run #{r.id} ({r.status.value}) — {r.created_at}"
+            if r.agent_name:
+                yield f"      Agent: {r.agent_name}"
+            if r.tokens_used:
+                yield f"      Tokens: {r.tokens_used}"
+            if r.pr_url:
+                yield f"      PR: {r.pr_url}"
+            if r.error:
+                yield f"      Error: {r.error[:200]}"
+            if r.agent_output:
+                excerpt = r.agent_output[:200].replace("\n", " ")
+                yield f"      Output: {excerpt}..."
+
+    return "\n".join(emit())
 
 
 def format_success_comment(issue_number: int, pr_url: str) -> str:
@@ -121,102 +152,105 @@ def generate_run_report(
 ) -> str:
     """Generate a per-issue Markdown report."""
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    status_map = {
-        RunStatus.SUCCESS: "Completed",
-        RunStatus.FAILED: "Failed",
-        RunStatus.TIMEOUT: "Timed out",
-        RunStatus.BLOCKED: "Blocked",
-        RunStatus.RUNNING: "In progress",
-        RunStatus.PENDING: "Pending",
-    }
-    status_label = status_map.get(run.status, run.status.value)
-
-    lines = [
-        f"# Run Report: Issue #{run.issue_number}",
-        "",
-        f"**Title:** {run.issue_title}",
-        f"**Repo:** {run.repo}",
-        f"**Status:** {status_label}",
-        f"**Generated:** {now}",
-    ]
-
-    if agent_result:
-        lines.append(f"**Agent:** {agent_result.agent_name}")
-        lines.append(f"**Tokens:** {agent_result.total_tokens} (in: {agent_result.input_tokens}, out: {agent_result.output_tokens})")
-    elif run.agent_name:
-        lines.append(f"**Agent:** {run.agent_name}")
-        if run.tokens_used:
-            lines.append(f"**Tokens:** {run.tokens_used}")
-
-    if run.pr_url:
-        lines.append(f"**PR:** {run.pr_url}")
-
-    if diff_detail:
-        lines.append(f"**Diff:** {diff_detail}")
-
-    if run.error:
-        lines.append("")
-        lines.append("## Error")
-        lines.append(f"```\n{run.error[:1000]}\n```")
-
-    if agent_result and agent_result.output:
-        excerpt = agent_result.output[:2000]
-        lines.append("")
-        lines.append("## Agent Output")
-        lines.append(f"```\n{excerpt}\n```")
-
-    lines.append("")
-    lines.append("## Next Steps")
-    if run.status == RunStatus.SUCCESS:
-        lines.append("- Review and merge the PR")
-    elif run.status == RunStatus.BLOCKED:
-        lines.append("- Address the blocking issue and retry")
-    elif run.status == RunStatus.TIMEOUT:
-        lines.append("- Consider breaking the issue into smaller tasks")
-    else:
-        lines.append("- Investigate the error and retry")
-
-    return "\n".join(lines)
+    status_label = _STATUS_LABEL.get(run.status, run.status.value)
+
+    def emit():
+        yield _RUN_REPORT_HEADER.format(
+            number=run.issue_number,
+            title=run.issue_title,
+            repo=run.repo,
+            status=status_label,
+            generated=now,
+        )
+
+        if agent_result:
+            yield f"**Agent:** {agent_result.agent_name}"
+            yield f"**Tokens:** {agent_result.total_tokens} (in: {agent_result.input_tokens}, out: {agent_result.output_tokens})"
+        elif run.agent_name:
+            yield f"**Agent:** {run.agent_name}"
+            if run.tokens_used:
+                yield f"**Tokens:** {run.tokens_used}"
+
+        if run.pr_url:
+            yield f"**PR:** {run.pr_url}"
+
+        if diff_detail:
+            yield f"**Diff:** {diff_detail}"
+
+        if run.error:
+            yield ""
+            yield "## Error"
+            yield f"```\n{run.error[:1000]}\n```"
+
+        if agent_result and agent_result.output:
+            excerpt = agent_result.output[:2000]
+            yield ""
+            yield "## Agent Output"
+            yield f"```\n{excerpt}\n```"
+
+        yield ""
+        yield "## Next Steps"
+        if run.status == RunStatus.SUCCESS:
+            yield "- Review and merge the PR"
+        elif run.status == RunStatus.BLOCKED:
+            yield "- Address the blocking issue and retry"
+        elif run.status == RunStatus.TIMEOUT:
+            yield "- Consider breaking the issue into smaller tasks"
+        else:
+            yield "- Investigate the error and retry"
+
+    return "\n".join(emit())
 
 
 def generate_session_report(runs: list[Run]) -> str:
     """Generate a session summary Markdown report."""
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
-    success = sum(1 for r in runs if r.status == RunStatus.SUCCESS)
-    failed = sum(1 for r in runs if r.status == RunStatus.FAILED)
-    timeout = sum(1 for r in runs if r.status == RunStatus.TIMEOUT)
-    blocked = sum(1 for r in runs if r.status == RunStatus.BLOCKED)
-
-    lines = [
-        "# Session Report",
-        "",
-        f"**Date:** {now}",
-        f"**Issues processed:** {len(runs)}",
-        f"**Success:** {success} | **Failed:** {failed} | **Timeout:** {timeout} | **Blocked:** {blocked}",
-        "",
-        "## Issues",
-    ]
-
-    for run in runs:
-        status_icon = {"success": "+", "failed": "x", "timeout": "T", "blocked": "B"}.get(run.status.value, "?")
-        agent_tag = f" ({run.agent_name})" if run.agent_name else ""
-        tokens_tag = f" [{run.tokens_used} tokens]" if run.tokens_used else ""
-        pr_tag = f" -> {run.pr_url}" if run.pr_url else ""
-        lines.append(f"- [{status_icon}] #{run.issue_number}: {run.issue_title}{agent_tag}{tokens_tag}{pr_tag}")
-        if run.error:
-            lines.append(f"  Error: {run.error[:100]}")
+    counts = Counter(r.status for r in runs)
+    success = counts[RunStatus.SUCCESS]
+    failed = counts[RunStatus.FAILED]
+    timeout = counts[RunStatus.TIMEOUT]
+    blocked = counts[RunStatus.BLOCKED]
+
+    def emit():
+        yield _SESSION_REPORT_HEADER.format(
+            date=now,
+            processed=len(runs),
+            success=success,
+            failed=failed,
+            timeout=timeout,
+            blocked=blocked,
+        )
+
+        for run in runs:
+            status_icon = _STATUS_ICON.get(run.status.value, "?")
+            agent_tag = f" ({run.agent_name})" if run.agent_name else ""
+            tokens_tag = f" [{run.tokens_used} tokens]" if run.tokens_used else ""
+            pr_tag = f" -> {run.pr_url}" if run.pr_url else ""
+            yield f"- [{status_icon}] #{run.issue_number}: {run.issue_title}{agent_tag}{tokens_tag}{pr_tag}"
+            if run.error:
+                yield f"  Error: {run.error[:100]}"
+
+    return "\n".join(emit())
+
 
-    return "\n".join(lines)
+# Directories already created this process; saves a mkdir syscall per report.
+_reports_dirs_created: set[Path] = set()
 
 
 def write_report_file(content: str, filename: str, config: Config) -> Path:
     """Write a report file to the reports directory."""
     repo_dir = Path(config.jarvis_repo_dir) if config.jarvis_repo_dir else Path.cwd()
     reports_dir = repo_dir / config.reports_dir
-    reports_dir.mkdir(parents=True, exist_ok=True)
+    if reports_dir not in _reports_dirs_created:
+        reports_dir.mkdir(parents=True, exist_ok=True)
+        _reports_dirs_created.add(reports_dir)
     path = reports_dir / filename
-    path.write_text(content, encoding="utf-8")
+    # Write-then-rename so a reader (or the report committer) never sees a
+    # half-written file if the process dies mid-write.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    tmp.replace(path)
     log.info("Wrote report: %s", path)
     return path
 
@@ -228,11 +262,34 @@ def report_filename(run: Run) -> str:
     return f"{date}_issue-{run.issue_number}_{repo_slug}.md"
 
 
+# Per-repo timestamp of the last commit_reports scan. Most cycles produce
+# no new report files, and the mtime probe below lets those cycles skip all
+# git subprocess spawns (fork+exec each) entirely.
+_last_reports_scan: dict[str, float] = {}
+
+
+def _reports_changed_since(reports_dir: Path, since: float) -> bool:
+    try:
+        return any(p.stat().st_mtime >= since for p in reports_dir.iterdir())
+    except OSError:
+        return True
+
+
 def commit_reports(config: Config, message: str) -> None:
     """Git add, commit, and push reports in the Jarvis22 repo."""
     repo_dir = Path(config.jarvis_repo_dir) if config.jarvis_repo_dir else Path.cwd()
     reports_path = config.reports_dir
 
+    scan_key = str(repo_dir)
+    last_scan = _last_reports_scan.get(scan_key)
+    if last_scan is not None and not _reports_changed_since(repo_dir / reports_path, last_scan):
+        log.debug("No report files changed since last scan; skipping git")
+        return
+    # Taken before the git sequence (so files written meanwhile still count
+    # as changed next cycle) but recorded only once it succeeds — a failed
+    # push must not suppress the retry on the next cycle.
+    scan_started = datetime.now(timezone.utc).timestamp()
+
     try:
         subprocess.run(
             ["git", "add", reports_path],
@@ -251,6 +308,7 @@ def commit_reports(config: Config, message: str) -> None:
         )
         if result.returncode == 0:
             log.info("No report changes to commit")
+            _last_reports_scan[scan_key] = scan_started
             return
 
         subprocess.run(
@@ -270,6 +328,7 @@ def commit_reports(config: Config, message: str) -> None:
             check=True,
         )
         log.info("Reports committed and pushed: %s", message)
+        _last_reports_scan[scan_key] = scan_started
     except subprocess.CalledProcessError as e:
         log.error("Failed to commit/push reports: %s", e.stderr or str(e))
     except subprocess.TimeoutExpired:
@@ -6,7 +6,10 @@ import hashlib
 import hmac
 import json
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 from jarvis.config import Config
 from jarvis.models import Trigger
@@ -15,18 +18,43 @@ from jarvis.orchestrator import Orchestrator
 log = logging.getLogger(__name__)
 
 
+# Recently seen X-GitHub-Delivery ids. GitHub retries deliveries it thinks
+# failed; remembering the last few hundred ids lets a retry be acknowledged
+# without re-verifying the HMAC or re-running the issue.
+_SEEN_DELIVERIES_MAX = 256
+
+
 class WebhookHandler(BaseHTTPRequestHandler):
     config: Config
     orchestrator: Orchestrator
+    executor: ThreadPoolExecutor
+    _seen_deliveries: OrderedDict[str, None] = OrderedDict()
+    _seen_lock = threading.Lock()
 
     def do_POST(self) -> None:
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
 
+        delivery = self.headers.get("X-GitHub-Delivery", "")
+        with self._seen_lock:
+            if delivery and delivery in self._seen_deliveries:
+                duplicate = True
+            else:
+                duplicate = False
+        if duplicate:
+            self._respond(200, {"status": "duplicate", "delivery": delivery})
+            return
+
         if not self._verify_signature(body):
             self._respond(403, {"error": "Invalid signature"})
             return
 
+        if delivery:
+            with self._seen_lock:
+                self._seen_deliveries[delivery] = None
+                while len(self._seen_deliveries) > _SEEN_DELIVERIES_MAX:
+                    self._seen_deliveries.popitem(last=False)
+
         event = self.headers.get("X-GitHub-Event", "")
         if event != "issues":
             self._respond(200, {"status": "ignored", "event": event})
@@ -64,6 +92,15 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
         self._respond(200, {"status": "accepted", "repo": repo_name, "issue": issue_number, "label": label_name})
 
+        # If a poller shares this orchestrator, cut its sleep short too.
+        self.orchestrator.wake()
+
+        # Hand the run to the bounded executor so the 200 above is the whole
+        # HTTP exchange; the handler thread is free for the next delivery
+        # while the run (git + agent subprocesses) proceeds in the pool.
+        self.executor.submit(self._run, issue_number, repo_name)
+
+    def _run(self, issue_number: int, repo_name: str) -> None:
         try:
             self.orchestrator.run_single(issue_number, repo_name, Trigger.WEBHOOK)
         except Exception:
@@ -94,8 +131,12 @@ def run_webhook(config: Config) -> None:
     orch = Orchestrator(config)
     WebhookHandler.config = config
     WebhookHandler.orchestrator = orch
+    WebhookHandler.executor = ThreadPoolExecutor(max_workers=config.max_concurrent_runs)
 
-    server = HTTPServer(("0.0.0.0", config.webhook_port), WebhookHandler)
+    # ThreadingHTTPServer: a handler busy in run_single (seconds to minutes)
+    # no longer blocks the accept loop, so concurrent deliveries each get a
+    # thread instead of queueing behind the slowest one.
+    server = ThreadingHTTPServer(("0.0.0.0", config.webhook_port), WebhookHandler)
     log.info("Webhook server listening on port %d", config.webhook_port)
 
     try:
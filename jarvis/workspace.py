@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import re
+import shlex
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -11,6 +18,30 @@ from jarvis.config import Config
 
 log = logging.getLogger(__name__)
 
+# numstat lines: "<added>\t<deleted>\t<path>" with "-" for binary files.
+# Matched over raw bytes so large diffs never get decoded or split per line.
+_NUMSTAT_RE = re.compile(rb"(?m)^(\d+|-)\t(\d+|-)\t")
+
+# Default timeout per git subcommand. Local-only operations get tight caps
+# so a wedged call fails in seconds instead of holding the issue for the
+# blanket two minutes; network operations get room to move real data.
+_GIT_TIMEOUTS = {
+    "config": 15,
+    "status": 30,
+    "rev-parse": 15,
+    "symbolic-ref": 15,
+    "branch": 30,
+    "checkout": 60,
+    "reset": 60,
+    "add": 60,
+    "commit": 60,
+    "diff": 60,
+    "fetch": 300,
+    "push": 180,
+    "clone": 600,
+}
+_DEFAULT_TIMEOUT = 120
+
 
 @dataclass(frozen=True)
 class CmdResult:
@@ -26,43 +57,156 @@ class Workspace:
         self._clone_url = clone_url
         self._repo_name = repo_name
         self._repo_dir = Path(config.workspace_dir) / repo_name.replace("/", "_")
+        # str() of the path is needed by every git -C invocation; do the
+        # PosixPath->str conversion once instead of per subprocess.
+        self._repo_dir_str = os.fspath(self._repo_dir)
+        # ensure_repo runs once per processed issue; remember per-process
+        # that user.name/email are already set so the warm path skips them.
+        self._configured = False
+        # run_test_cmd results keyed on (cmd, tree state); see _tree_state.
+        self._test_cache: dict[tuple[str, str], CmdResult] = {}
+        # The remote HEAD doesn't move mid-run; resolve it once per instance.
+        self._default_branch: str | None = None
 
     @property
     def repo_dir(self) -> Path:
         return self._repo_dir
 
-    def _run(self, cmd: list[str], cwd: Path | None = None, timeout: int = 120) -> str:
-        log.debug("Running: %s (cwd=%s)", " ".join(cmd), cwd)
+    def _run(self, cmd: list[str], cwd: Path | None = None, timeout: int | None = None, capture: bool = True) -> str:
+        if timeout is None:
+            timeout = _GIT_TIMEOUTS.get(cmd[1], _DEFAULT_TIMEOUT) if cmd and cmd[0] == "git" and len(cmd) > 1 else _DEFAULT_TIMEOUT
+        # Git commands get -C instead of cwd=: with cwd=None CPython can use
+        # posix_spawn rather than the slower fork+chdir+exec fallback it
+        # takes whenever a working directory is supplied.
+        run_cwd: str | Path | None = os.fspath(cwd) if cwd is not None else self._repo_dir_str
+        if cmd and cmd[0] == "git":
+            cmd = ["git", "-C", run_cwd, *cmd[1:]]
+            run_cwd = None
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Running: %s (cwd=%s)", " ".join(cmd), run_cwd)
+        # capture=False skips the stdout pipe + decode for commands whose
+        # output is never read (branch deletes, worktree ops); stderr is
+        # always captured for the error message.
         result = subprocess.run(
             cmd,
-            cwd=cwd or self._repo_dir,
-            capture_output=True,
+            cwd=run_cwd,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=timeout,
         )
         if result.returncode != 0:
             raise RuntimeError(f"Command failed: {' '.join(cmd)}\nstderr: {result.stderr}")
+        return result.stdout.strip() if capture else ""
+
+    def _run_batch(self, cmds: list[list[str]], timeout: int = 120) -> str:
+        """Run several commands as one &&-chained shell invocation.
+
+        Sequential git steps that always run together (fetch → checkout →
+        reset) each paid their own fork+exec through _run; joining them
+        spawns a single shell instead. The chain stops at the first failing
+        step, matching _run's raise-on-failure behavior.
+        """
+        joined = " && ".join(shlex.join(c) for c in cmds)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Running batch: %s", joined)
+        result = subprocess.run(
+            ["bash", "-c", joined],
+            cwd=self._repo_dir_str,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Command failed: {joined}\nstderr: {result.stderr}")
         return result.stdout.strip()
 
     def ensure_repo(self) -> None:
+        # The clone under workspace_dir is the persistent cache: warm runs
+        # pay an incremental fetch, never a re-clone.
         if (self._repo_dir / ".git").exists():
+            if self._is_fresh():
+                log.info("[%s] Repo fetched recently, skipping refresh", self._repo_name)
+                return
             log.info("[%s] Repo already cloned, pulling latest", self._repo_name)
-            self._run(["git", "fetch", "--all"])
             default = self._get_default_branch()
-            self._run(["git", "checkout", default])
-            self._run(["git", "reset", "--hard", f"origin/{default}"])
+            if self._config.shallow_clone:
+                # Only the default-branch tip is ever used; fetching just
+                # that ref at the configured depth keeps the transfer at a
+                # few objects instead of every branch's new history.
+                fetch = ["git", "fetch", f"--depth={self._config.shallow_clone_depth}", "origin", default]
+            else:
+                fetch = ["git", "fetch", "--prune", "origin"]
+            # Budget: the chained commands' individual table timeouts, since
+            # the default batch timeout is far below the fetch's allowance.
+            self._run_batch(
+                [
+                    fetch,
+                    ["git", "checkout", default],
+                    ["git", "reset", "--hard", f"origin/{default}"],
+                ],
+                timeout=_GIT_TIMEOUTS["fetch"] + _GIT_TIMEOUTS["checkout"] + _GIT_TIMEOUTS["reset"],
+            )
         else:
             log.info("[%s] Cloning repo to %s", self._repo_name, self._repo_dir)
             self._repo_dir.mkdir(parents=True, exist_ok=True)
-            self._run(
-                ["git", "clone", self._clone_url, str(self._repo_dir)],
-                cwd=self._repo_dir.parent,
-                timeout=600,
-            )
-        self._run(["git", "config", "user.email", "jarvis@bot.dev"])
-        self._run(["git", "config", "user.name", "Jarvis"])
+            cmd = ["git", "clone"]
+            if self._config.shallow_clone:
+                # History is never read — branches start from tip and diffs
+                # run against origin/<default> — so skip old commits, blobs,
+                # and tags. Pushing new branches works fine from a shallow
+                # clone; `git fetch --unshallow` is the escape hatch.
+                cmd += [
+                    f"--depth={self._config.shallow_clone_depth}",
+                    "--filter=blob:none",
+                    "--single-branch",
+                    "--no-tags",
+                ]
+            cmd += [self._clone_url, str(self._repo_dir)]
+            self._run(cmd, cwd=self._repo_dir.parent, timeout=600)
+            self._configured = False
+            self._default_branch = None
+        if not self._configured:
+            self._run_batch([
+                ["git", "config", "user.email", "jarvis@bot.dev"],
+                ["git", "config", "user.name", "Jarvis"],
+                # Clones use HTTPS (see GitHubClient.clone_url): HTTP/2 lets
+                # libcurl multiplex/reuse the connection across the
+                # fetch+push pairs of a run, and a large postBuffer keeps
+                # pushes out of slower chunked transfer encoding.
+                ["git", "config", "http.version", "HTTP/2"],
+                ["git", "config", "http.postBuffer", "524288000"],
+            ])
+            self._configured = True
+
+    def _is_fresh(self) -> bool:
+        """Whether the last fetch is within REPO_REFRESH_S, judged by the
+        mtime git leaves on .git/FETCH_HEAD — one stat instead of a
+        fetch/checkout/reset subprocess round-trip per cycle."""
+        window = self._config.repo_refresh_s
+        if window <= 0 or not self._configured:
+            return False
+        try:
+            fetched_at = (self._repo_dir / ".git" / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - fetched_at < window
 
     def _get_default_branch(self) -> str:
+        # ensure_repo, base_ref, and worktree_for all need this; memoize so
+        # one issue resolves it once instead of three-plus times.
+        if self._default_branch is None:
+            self._default_branch = self._compute_default_branch()
+        return self._default_branch
+
+    def _compute_default_branch(self) -> str:
+        # origin/HEAD is a local ref written at clone time — reading it
+        # avoids the network round-trip of `git remote show origin`.
+        try:
+            ref = self._run(["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"])
+            return ref.removeprefix("origin/")
+        except RuntimeError:
+            pass
         output = self._run(["git", "remote", "show", "origin"])
         for line in output.splitlines():
             if "HEAD branch" in line:
@@ -73,20 +217,52 @@ class Workspace:
         default = self._get_default_branch()
         return f"origin/{default}"
 
-    def create_branch(self, branch: str) -> None:
-        try:
-            self._run(["git", "branch", "-D", branch])
-            log.info("[%s] Deleted existing local branch %s", self._repo_name, branch)
-        except RuntimeError:
-            pass
-        try:
-            self._run(["git", "push", "origin", "--delete", branch])
-            log.info("[%s] Deleted existing remote branch %s", self._repo_name, branch)
-        except RuntimeError:
-            pass
+    def worktree_for(self, branch: str) -> Workspace:
+        """Create an isolated working tree for ``branch`` and return a
+        Workspace rooted there.
+
+        Worktrees share the main clone's object store, so concurrent issues
+        on the same repo each get their own checkout without duplicating
+        packfiles or re-cloning. Branch state is fully reset: any previous
+        remote branch is deleted and the local branch is force-reset to the
+        default-branch tip.
+        """
+        wt_dir = self._repo_dir.parent / f"{self._repo_dir.name}@{branch.replace('/', '_')}"
+        if wt_dir.exists():
+            shutil.rmtree(wt_dir)
+        # The prune is local and the remote delete is an RTT to GitHub;
+        # running them together hides the prune entirely. Both are cleanup
+        # that tolerates the target not existing, and the worktree add below
+        # waits for both.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            prune = pool.submit(self._run, ["git", "worktree", "prune"], capture=False)
+            remote_delete = pool.submit(self._run, ["git", "push", "origin", "--delete", branch], capture=False)
+            try:
+                prune.result()
+            except RuntimeError:
+                pass
+            try:
+                remote_delete.result()
+                log.info("[%s] Deleted existing remote branch %s", self._repo_name, branch)
+            except RuntimeError:
+                pass
         default = self._get_default_branch()
-        self._run(["git", "checkout", "-b", branch, f"origin/{default}"])
-        log.info("[%s] Created branch %s", self._repo_name, branch)
+        self._run(
+            ["git", "worktree", "add", "--force", "-B", branch, str(wt_dir), f"origin/{default}"],
+            timeout=300,
+            capture=False,
+        )
+        log.info("[%s] Created worktree %s for branch %s", self._repo_name, wt_dir, branch)
+        ws = Workspace(self._config, self._clone_url, self._repo_name)
+        ws._repo_dir = wt_dir
+        ws._repo_dir_str = os.fspath(wt_dir)
+        ws._configured = True  # repo config is shared across worktrees
+        ws._default_branch = self._default_branch
+        return ws
+
+    def release_worktree(self, worktree: Workspace) -> None:
+        """Remove a worktree created by worktree_for (call from the main Workspace)."""
+        self._run(["git", "worktree", "remove", "--force", str(worktree.repo_dir)], capture=False)
 
     def has_changes(self) -> bool:
         status = self._run(["git", "status", "--porcelain"])
@@ -105,10 +281,82 @@ class Workspace:
             return out[:max_chars] + "\n\n...(truncated)"
         return out
 
+    def diff_with_stat(self, max_stat_lines: int = 200, max_chars: int = 40000) -> tuple[str, str]:
+        """Return (diffstat, diff) from a single git invocation.
+
+        The reviewer needs both every round; --stat --patch emits the stat
+        block followed by the patch, so one subprocess serves both instead
+        of two.
+        """
+        base = self.base_ref()
+        out = self._run(["git", "diff", "--stat", "--patch", f"{base}...HEAD"])
+        if not out:
+            return "(no diff)", "(no diff)"
+        split = out.find("diff --git ")
+        if split <= 0:
+            stat, patch = out, "(no diff)"
+        else:
+            stat, patch = out[:split].rstrip(), out[split:]
+        stat = "\n".join(stat.splitlines()[:max_stat_lines])
+        if len(patch) > max_chars:
+            patch = patch[:max_chars] + "\n\n...(truncated)"
+        return stat, patch
+
+    def check_diff_limits(self, max_files: int, max_loc: int) -> tuple[bool, str]:
+        """Check the staged diff against the MAX_DIFF_FILES/MAX_DIFF_LOC guardrails.
+
+        Stages everything first (commit_and_push re-stages idempotently) so
+        new files count, then scans numstat as raw bytes with a compiled
+        regex, bailing out the moment either limit is crossed — an oversized
+        diff is rejected without parsing the rest of it.
+        """
+        self._run(["git", "add", "-A"], capture=False)
+        p = subprocess.run(
+            ["git", "-C", self._repo_dir_str, "diff", "--numstat", "--cached"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=120,
+        )
+        if p.returncode != 0:
+            raise RuntimeError(f"Command failed: git diff --numstat --cached\nstderr: {p.stderr.decode(errors='replace')}")
+        files_changed = 0
+        total_loc = 0
+        for match in _NUMSTAT_RE.finditer(p.stdout):
+            files_changed += 1
+            if files_changed > max_files:
+                return False, f"more than {max_files} files changed"
+            added, deleted = match.group(1), match.group(2)
+            if added != b"-":
+                total_loc += int(added)
+            if deleted != b"-":
+                total_loc += int(deleted)
+            if total_loc > max_loc:
+                return False, f"more than {max_loc} lines changed"
+        return True, f"{files_changed} files, {total_loc} lines changed"
+
+    def _tree_state(self) -> str:
+        """Fingerprint of the working tree: HEAD plus any uncommitted changes."""
+        state = self._run(["git", "rev-parse", "HEAD"])
+        dirty = self._run(["git", "status", "--porcelain"])
+        if dirty:
+            diff = self._run(["git", "diff", "HEAD"])
+            state += "|" + hashlib.blake2b((dirty + diff).encode(), digest_size=16).hexdigest()
+        return state
+
     def run_test_cmd(self, cmd: str, timeout_s: int) -> CmdResult:
         if not cmd.strip():
             return CmdResult(cmd=cmd, exit_code=0, stdout="(no TEST_CMD configured)", stderr="")
 
+        # The review loop reruns tests every round, but when the implementer
+        # made no new changes the tree is byte-identical to the previous
+        # round — replay the recorded result instead of paying interpreter
+        # startup and a full suite run again.
+        key = (cmd, self._tree_state())
+        cached = self._test_cache.get(key)
+        if cached is not None:
+            log.info("[%s] TEST_CMD unchanged tree; reusing previous result", self._repo_name)
+            return cached
+
         log.info("[%s] Running TEST_CMD: %s", self._repo_name, cmd)
         p = subprocess.run(
             ["bash", "-lc", cmd],
@@ -117,16 +365,27 @@ class Workspace:
             text=True,
             timeout=timeout_s,
         )
-        return CmdResult(cmd=cmd, exit_code=p.returncode, stdout=p.stdout or "", stderr=p.stderr or "")
+        result = CmdResult(cmd=cmd, exit_code=p.returncode, stdout=p.stdout or "", stderr=p.stderr or "")
+        self._test_cache[key] = result
+        return result
 
     def commit_and_push(self, branch: str, message: str) -> bool:
         status = self._run(["git", "status", "--porcelain"])
         if not status:
             log.warning("[%s] No changes to commit", self._repo_name)
             return False
-        self._run(["git", "add", "-A"])
-        self._run(["git", "commit", "-m", message])
-        self._run(["git", "push", "-u", "origin", branch])
+        # One spawn for the whole add/commit/push sequence; the && chain
+        # stops at the first failing step and _run_batch's error names it.
+        # The batch gets the chain's combined table budget so the push keeps
+        # its full network allowance.
+        self._run_batch(
+            [
+                ["git", "add", "-A"],
+                ["git", "commit", "-m", message],
+                ["git", "push", "-u", "origin", branch],
+            ],
+            timeout=_GIT_TIMEOUTS["add"] + _GIT_TIMEOUTS["commit"] + _GIT_TIMEOUTS["push"],
+        )
         log.info("[%s] Pushed branch %s", self._repo_name, branch)
         return True
 
@@ -1,21 +1,50 @@
 """Tests for the database module."""
 
-import os
-import tempfile
+import shutil
+import sqlite3
 
 import pytest
 
 from jarvis.db import Database
 from jarvis.models import RunStatus, Trigger
 
+# The schema as the first release created it: status/trigger stored as TEXT
+# and no repo/agent_name/tokens_used columns. Used to verify migration.
+_LEGACY_SCHEMA = """\
+CREATE TABLE runs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    issue_number INTEGER NOT NULL,
+    issue_title  TEXT NOT NULL,
+    status       TEXT NOT NULL DEFAULT 'pending',
+    trigger      TEXT NOT NULL,
+    branch       TEXT,
+    pr_url       TEXT,
+    error        TEXT,
+    agent_output TEXT,
+    created_at   TEXT NOT NULL DEFAULT (datetime('now')),
+    updated_at   TEXT NOT NULL DEFAULT (datetime('now'))
+);
+"""
+
+
+@pytest.fixture(scope="session")
+def template_db_path(tmp_path_factory):
+    """A database file with the schema applied, built once per session.
+
+    Copying it is much cheaper than re-running DDL + migrations for every
+    test, and tmp_path handles cleanup (the old NamedTemporaryFile fixture
+    leaked files on test failure).
+    """
+    path = tmp_path_factory.mktemp("db-template") / "template.db"
+    Database(str(path)).close()
+    return path
+
 
 @pytest.fixture
-def db():
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    d = Database(db_path)
-    yield d
-    os.unlink(db_path)
+def db(template_db_path, tmp_path):
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db_path, db_path)
+    return Database(str(db_path))
 
 
 def test_create_run(db: Database):
@@ -110,3 +139,44 @@ def test_is_issue_claimed_scoped_to_repo(db: Database):
     db.create_run(1, "Issue 1", Trigger.CLI, repo="owner/repoA")
     assert db.is_issue_claimed(1, repo="owner/repoA") is True
     assert db.is_issue_claimed(1, repo="owner/repoB") is False
+
+
+def test_status_histogram(db: Database):
+    db.create_run(1, "Issue 1", Trigger.CLI)
+    run = db.create_run(2, "Issue 2", Trigger.POLL)
+    db.update_run(run.id, status=RunStatus.FAILED)
+    counts = db.status_histogram()
+    assert counts[RunStatus.PENDING] == 1
+    assert counts[RunStatus.FAILED] == 1
+
+
+def test_migrates_legacy_text_schema(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(_LEGACY_SCHEMA)
+    conn.execute(
+        "INSERT INTO runs (issue_number, issue_title, status, trigger) VALUES (?, ?, ?, ?)",
+        (7, "Old issue", "success", "poll"),
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(str(db_path))
+    run = db.get_runs_for_issue(7)[0]
+    assert run.status == RunStatus.SUCCESS
+    assert run.trigger == Trigger.POLL
+    assert run.repo == ""
+
+    # New writes land as integer codes and round-trip alongside migrated rows.
+    created = db.create_run(8, "New issue", Trigger.CLI, repo="owner/repo")
+    db.update_run(created.id, status=RunStatus.FAILED)
+    assert db.get_run(created.id).status == RunStatus.FAILED
+    assert {r.issue_number for r in db.get_all_runs()} == {7, 8}
+
+
+def test_recent_by_status_limit_and_order(db: Database):
+    for n in range(1, 4):
+        run = db.create_run(n, f"Issue {n}", Trigger.CLI)
+        db.update_run(run.id, status=RunStatus.FAILED)
+    recent = db.recent_by_status(RunStatus.FAILED, limit=2)
+    assert [r.issue_number for r in recent] == [3, 2]
@@ -1,197 +1,167 @@
 """Tests for the orchestrator module."""
 
-import os
-import tempfile
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+import jarvis.orchestrator as orchestrator_module
 from jarvis.config import Config
 from jarvis.db import Database
 from jarvis.models import AgentResult, IssueContext, RunStatus, Trigger
 from jarvis.orchestrator import Orchestrator
 
 
+# In-memory SQLite: these tests only touch the database through the single
+# Orchestrator instance, so there is no on-disk file, WAL, or fsync to pay
+# for per test.
 @pytest.fixture
-def config():
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    cfg = Config(
+def config(tmp_path):
+    return Config(
         github_token="fake-token",
         target_repos=("owner/repo",),
         anthropic_api_key="fake-key",
-        db_path=db_path,
-        workspace_dir=tempfile.mkdtemp(),
+        db_path=":memory:",
+        workspace_dir=str(tmp_path / "workspace"),
     )
-    yield cfg
-    os.unlink(db_path)
 
 
 @pytest.fixture
-def multi_repo_config():
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    cfg = Config(
+def multi_repo_config(tmp_path):
+    return Config(
         github_token="fake-token",
         target_repos=("owner/repoA", "owner/repoB"),
         anthropic_api_key="fake-key",
-        db_path=db_path,
-        workspace_dir=tempfile.mkdtemp(),
+        db_path=":memory:",
+        workspace_dir=str(tmp_path / "workspace"),
     )
-    yield cfg
-    os.unlink(db_path)
 
 
-@pytest.fixture
+# Module-scoped: IssueContext is never mutated by these tests, so one
+# instance (with an immutable labels tuple to keep it that way) serves the
+# whole file instead of being rebuilt per test.
+@pytest.fixture(scope="module")
 def mock_issue():
     return IssueContext(
         number=42,
         title="Fix the bug",
         body="There is a bug in main.py",
         repo="owner/repo",
-        labels=["jarvis"],
+        labels=("jarvis",),
     )
 
 
-def _make_orch(config):
-    """Create an Orchestrator bypassing __init__ but setting all required attrs."""
+@pytest.fixture
+def orch_mocks(monkeypatch):
+    """GitHubClient/Workspace/run_agent mocks patched in one place.
+
+    Each test previously stacked three @patch decorators plus identical
+    wiring; monkeypatch against the pre-imported module skips mock's
+    string-target resolution and undoes itself on teardown.
+    """
+    gh = MagicMock()
+    ws = MagicMock()
+    agent = MagicMock()
+    monkeypatch.setattr(orchestrator_module, "GitHubClient", MagicMock(return_value=gh))
+    monkeypatch.setattr(orchestrator_module, "Workspace", MagicMock(return_value=ws))
+    monkeypatch.setattr(orchestrator_module, "run_agent", agent)
+    gh.clone_url = "https://github.com/owner/repo.git"
+    ws.branch_name.return_value = "jarvis/issue-42"
+    return SimpleNamespace(gh=gh, ws=ws, agent=agent)
+
+
+@pytest.fixture
+def orch(config, orch_mocks):
+    """An Orchestrator with its owner/repo handler pre-wired to orch_mocks.
+
+    Bypasses __init__ (no real GitHub/workspace setup) but sets all required
+    attrs, replacing the _make_orch helper plus the identical three-line
+    handler wiring every test repeated.
+    """
     orch = Orchestrator.__new__(Orchestrator)
     orch.config = config
     orch.db = Database(config.db_path)
-    orch._handlers = {}
+    # SimpleNamespace instead of MagicMock: handlers are plain attribute
+    # bags, and a namespace raises on any attribute the tests forgot to
+    # wire rather than silently minting a new mock.
+    orch._handlers = {"owner/repo": SimpleNamespace(gh=orch_mocks.gh, workspace=orch_mocks.ws)}
     orch._session_tokens = 0
     return orch
 
 
-@patch("jarvis.orchestrator.GitHubClient")
-@patch("jarvis.orchestrator.Workspace")
-@patch("jarvis.orchestrator.run_agent")
-def test_process_issue_success(mock_agent, mock_ws_cls, mock_gh_cls, config, mock_issue):
-    mock_agent.return_value = AgentResult(output="I fixed the bug", agent_name="claude", total_tokens=1000)
-    mock_ws = mock_ws_cls.return_value
-    mock_ws.repo_dir = config.workspace_dir
-    mock_ws.branch_name.return_value = "jarvis/issue-42"
-    mock_ws.commit_and_push.return_value = True
-    mock_ws.check_diff_limits.return_value = (True, "2 files changed, 10 LOC")
-
-    mock_gh = mock_gh_cls.return_value
-    mock_gh.create_pr.return_value = "https://github.com/owner/repo/pull/1"
-    mock_gh.clone_url = "https://github.com/owner/repo.git"
-
-    orch = _make_orch(config)
-    orch._handlers = {"owner/repo": MagicMock()}
-    orch._handlers["owner/repo"].gh = mock_gh
-    orch._handlers["owner/repo"].workspace = mock_ws
-
-    orch.process_issue(mock_issue, Trigger.CLI)
-
-    runs = orch.db.get_runs_for_issue(42)
-    assert len(runs) == 1
-    assert runs[0].status == RunStatus.SUCCESS
-    assert runs[0].pr_url == "https://github.com/owner/repo/pull/1"
-    assert runs[0].repo == "owner/repo"
-    assert runs[0].agent_name == "claude"
-    assert runs[0].tokens_used == 1000
-
-    mock_agent.assert_called_once()
-    mock_gh.create_pr.assert_called_once()
-    mock_gh.swap_labels.assert_called_once_with(42)
-
-
-@patch("jarvis.orchestrator.GitHubClient")
-@patch("jarvis.orchestrator.Workspace")
-@patch("jarvis.orchestrator.run_agent")
-def test_process_issue_no_changes(mock_agent, mock_ws_cls, mock_gh_cls, config, mock_issue):
-    mock_agent.return_value = AgentResult(output="I looked at it but nothing to change", agent_name="claude")
-    mock_ws = mock_ws_cls.return_value
-    mock_ws.repo_dir = config.workspace_dir
-    mock_ws.branch_name.return_value = "jarvis/issue-42"
-    mock_ws.commit_and_push.return_value = False
-    mock_ws.check_diff_limits.return_value = (True, "No changes")
-
-    mock_gh = mock_gh_cls.return_value
-    mock_gh.clone_url = "https://github.com/owner/repo.git"
-
-    orch = _make_orch(config)
-    orch._handlers = {"owner/repo": MagicMock()}
-    orch._handlers["owner/repo"].gh = mock_gh
-    orch._handlers["owner/repo"].workspace = mock_ws
-
-    orch.process_issue(mock_issue, Trigger.CLI)
-
-    runs = orch.db.get_runs_for_issue(42)
-    assert len(runs) == 1
-    assert runs[0].status == RunStatus.FAILED
-    assert "no file changes" in runs[0].error.lower()
-
-
-@patch("jarvis.orchestrator.GitHubClient")
-@patch("jarvis.orchestrator.Workspace")
-@patch("jarvis.orchestrator.run_agent")
-def test_process_issue_agent_failure(mock_agent, mock_ws_cls, mock_gh_cls, config, mock_issue):
-    mock_agent.side_effect = RuntimeError("Claude Code crashed")
-    mock_ws = mock_ws_cls.return_value
-    mock_ws.repo_dir = config.workspace_dir
-    mock_ws.branch_name.return_value = "jarvis/issue-42"
-
-    mock_gh = mock_gh_cls.return_value
-    mock_gh.clone_url = "https://github.com/owner/repo.git"
-
-    orch = _make_orch(config)
-    orch._handlers = {"owner/repo": MagicMock()}
-    orch._handlers["owner/repo"].gh = mock_gh
-    orch._handlers["owner/repo"].workspace = mock_ws
+# One parametrized test covers the happy path and the two plain failure
+# paths: same wiring, one collection pass, and a new outcome is a new row
+# here rather than another copy of the setup block.
+@pytest.mark.parametrize(
+    ("agent_outcome", "push_ok", "expected_status", "error_substr"),
+    [
+        pytest.param(
+            AgentResult(output="I fixed the bug", agent_name="claude", total_tokens=1000),
+            True,
+            RunStatus.SUCCESS,
+            None,
+            id="success",
+        ),
+        pytest.param(
+            AgentResult(output="I looked at it but nothing to change", agent_name="claude"),
+            False,
+            RunStatus.FAILED,
+            "no file changes",
+            id="no-changes",
+        ),
+        pytest.param(
+            RuntimeError("Claude Code crashed"),
+            False,
+            RunStatus.FAILED,
+            "crashed",
+            id="agent-failure",
+        ),
+    ],
+)
+def test_process_issue_outcomes(orch, orch_mocks, config, mock_issue, agent_outcome, push_ok, expected_status, error_substr):
+    if isinstance(agent_outcome, Exception):
+        orch_mocks.agent.side_effect = agent_outcome
+    else:
+        orch_mocks.agent.return_value = agent_outcome
+    orch_mocks.ws.repo_dir = config.workspace_dir
+    orch_mocks.ws.commit_and_push.return_value = push_ok
+    orch_mocks.ws.check_diff_limits.return_value = (True, "2 files changed, 10 LOC")
+    orch_mocks.gh.create_pr.return_value = "https://github.com/owner/repo/pull/1"
 
     orch.process_issue(mock_issue, Trigger.CLI)
 
     runs = orch.db.get_runs_for_issue(42)
     assert len(runs) == 1
-    assert runs[0].status == RunStatus.FAILED
-    assert "crashed" in runs[0].error.lower()
-
+    assert runs[0].status == expected_status
+    if error_substr is not None:
+        assert error_substr in runs[0].error.lower()
 
-@patch("jarvis.orchestrator.GitHubClient")
-@patch("jarvis.orchestrator.Workspace")
-@patch("jarvis.orchestrator.run_agent")
-def test_process_issue_diff_exceeds_limits(mock_agent, mock_ws_cls, mock_gh_cls, config, mock_issue):
-    mock_agent.return_value = AgentResult(output="Changed a lot", agent_name="claude", total_tokens=500)
-    mock_ws = mock_ws_cls.return_value
-    mock_ws.repo_dir = config.workspace_dir
-    mock_ws.branch_name.return_value = "jarvis/issue-42"
-    mock_ws.check_diff_limits.return_value = (False, "Exceeds file limit: 25 files changed, 600 LOC (max 20 files)")
+    if expected_status == RunStatus.SUCCESS:
+        assert runs[0].pr_url == "https://github.com/owner/repo/pull/1"
+        assert runs[0].repo == "owner/repo"
+        assert runs[0].agent_name == "claude"
+        assert runs[0].tokens_used == 1000
+        orch_mocks.agent.assert_called_once()
+        orch_mocks.gh.create_pr.assert_called_once()
+        orch_mocks.gh.swap_labels.assert_called_once_with(42)
 
-    mock_gh = mock_gh_cls.return_value
-    mock_gh.clone_url = "https://github.com/owner/repo.git"
 
-    orch = _make_orch(config)
-    orch._handlers = {"owner/repo": MagicMock()}
-    orch._handlers["owner/repo"].gh = mock_gh
-    orch._handlers["owner/repo"].workspace = mock_ws
+def test_process_issue_diff_exceeds_limits(orch, orch_mocks, config, mock_issue):
+    orch_mocks.agent.return_value = AgentResult(output="Changed a lot", agent_name="claude", total_tokens=500)
+    orch_mocks.ws.repo_dir = config.workspace_dir
+    orch_mocks.ws.check_diff_limits.return_value = (False, "Exceeds file limit: 25 files changed, 600 LOC (max 20 files)")
 
     run = orch.process_issue(mock_issue, Trigger.CLI)
 
     assert run.status == RunStatus.BLOCKED
     assert "exceeds limits" in run.error.lower()
-    mock_ws.commit_and_push.assert_not_called()
+    orch_mocks.ws.commit_and_push.assert_not_called()
 
 
-@patch("jarvis.orchestrator.GitHubClient")
-@patch("jarvis.orchestrator.Workspace")
-@patch("jarvis.orchestrator.run_agent")
-def test_process_issue_timeout(mock_agent, mock_ws_cls, mock_gh_cls, config, mock_issue):
+def test_process_issue_timeout(orch, orch_mocks, config, mock_issue):
     from jarvis.agent import AgentTimeoutError
-    mock_agent.side_effect = AgentTimeoutError("partial output here", "claude", 1200)
-    mock_ws = mock_ws_cls.return_value
-    mock_ws.repo_dir = config.workspace_dir
-    mock_ws.branch_name.return_value = "jarvis/issue-42"
-
-    mock_gh = mock_gh_cls.return_value
-    mock_gh.clone_url = "https://github.com/owner/repo.git"
-
-    orch = _make_orch(config)
-    orch._handlers = {"owner/repo": MagicMock()}
-    orch._handlers["owner/repo"].gh = mock_gh
-    orch._handlers["owner/repo"].workspace = mock_ws
+    orch_mocks.agent.side_effect = AgentTimeoutError("partial output here", "claude", 1200)
+    orch_mocks.ws.repo_dir = config.workspace_dir
 
     run = orch.process_issue(mock_issue, Trigger.CLI)
 
@@ -200,12 +170,8 @@ def test_process_issue_timeout(mock_agent, mock_ws_cls, mock_gh_cls, config, moc
     assert run.agent_name == "claude"
 
 
-def test_poll_once_skips_claimed(config, mock_issue):
-    orch = _make_orch(config)
-
-    mock_handler = MagicMock()
-    mock_handler.gh.get_labeled_issues.return_value = [mock_issue]
-    orch._handlers = {"owner/repo": mock_handler}
+def test_poll_once_skips_claimed(orch, orch_mocks, mock_issue):
+    orch_mocks.gh.get_labeled_issues.return_value = [mock_issue]
 
     # Pre-claim the issue
     orch.db.create_run(42, "Fix the bug", Trigger.CLI, repo="owner/repo")